@@ -1,22 +1,53 @@
 """JTR Generator - JIS規格準拠の日本の履歴書PDF生成パッケージ"""
 
-from .career_sheet_generator import generate_career_sheet_pdf
-from .helper.config import load_config, resolve_font_paths
-from .rirekisho_data import (
-    format_validation_error_ja,
-    load_rirekisho_data,
-    load_validated_data,
-    validate_and_load_data,
-)
-from .rirekisho_generator import generate_rirekisho_pdf
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .career_sheet_generator import generate_career_sheet_pdf
+    from .helper.config import load_config, resolve_font_paths
+    from .rirekisho_data import (
+        format_validation_error_ja,
+        load_rirekisho_batch,
+        load_rirekisho_data,
+        load_validated_data,
+        validate_and_load_data,
+    )
+    from .rirekisho_generator import generate_rirekisho_pdf
 
 __all__ = [
     "generate_rirekisho_pdf",
     "generate_career_sheet_pdf",
     "load_rirekisho_data",
+    "load_rirekisho_batch",
     "load_validated_data",
     "validate_and_load_data",
     "format_validation_error_ja",
     "load_config",
     "resolve_font_paths",
 ]
+
+# 公開名と定義モジュールの対応。jtr.helper だけを使う場合に
+# reportlab・jsonschemaの読み込みが発生しないよう、初回アクセス時に読み込む（PEP 562）
+_EXPORTS = {
+    "generate_rirekisho_pdf": ".rirekisho_generator",
+    "generate_career_sheet_pdf": ".career_sheet_generator",
+    "load_rirekisho_data": ".rirekisho_data",
+    "load_rirekisho_batch": ".rirekisho_data",
+    "load_validated_data": ".rirekisho_data",
+    "validate_and_load_data": ".rirekisho_data",
+    "format_validation_error_ja": ".rirekisho_data",
+    "load_config": ".helper.config",
+    "resolve_font_paths": ".helper.config",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -5,8 +5,13 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from io import BytesIO
 from pathlib import Path
 from typing import Any
+from xml.sax.saxutils import escape
 
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
@@ -24,9 +29,10 @@ from reportlab.platypus import (
     TableStyle,
 )
 
-from .helper.config import resolve_style_colors
+from .helper.config import DEFAULT_STYLE_COLORS, resolve_style_colors
 from .helper.fonts import find_default_font, register_font
 from .helper.generation_context import get_generation_context, init_generation_context
+from .helper.output import write_bytes_atomic
 from .layout.career_sheet import load_career_sheet_spacing_rules
 from .markdown_to_richtext import HeadingBar, markdown_to_flowables
 
@@ -37,6 +43,11 @@ _SPACING_MM_VALUES, _SPACING_PT, _INDENT_MM_VALUES = load_career_sheet_spacing_r
 _SPACING_MM = {key: value * mm for key, value in _SPACING_MM_VALUES.items()}
 _INDENT_MM = {key: value * mm for key, value in _INDENT_MM_VALUES.items()}
 _BODY_LEADING_PT = _SPACING_PT["body_leading"]
+_PAGE_MARGIN = 20 * mm
+_CONTACT_COLUMN_WIDTHS = (85 * mm, 85 * mm)
+_CONTACT_ROW_HEIGHTS = (_SPACING_MM["xl"], _SPACING_MM["xl"])
+# 区切り線の色が未指定の場合のフォールバック（既定パレットのsub）
+_DEFAULT_RULE_COLOR = colors.HexColor(DEFAULT_STYLE_COLORS["sub"])
 
 
 def generate_career_sheet_pdf(
@@ -58,21 +69,19 @@ def generate_career_sheet_pdf(
         FileNotFoundError: フォントファイルが見つからない場合
         ValueError: データ形式エラー
     """
-    # フォント登録
+    # フォント登録（登録済みならregister_font側で再解析を省略する）
     font_path = _resolve_career_sheet_font(options)
-    if not font_path.exists():
-        raise FileNotFoundError(f"フォントファイルが見つかりません: {font_path}")
-
     font_name = register_font(font_path)
 
-    # PDFドキュメント作成
+    # PDFドキュメント作成（メモリ上で組版し、完成後に出力先へ書き込む）
+    buffer = BytesIO()
     doc = BaseDocTemplate(
-        str(output_path),
+        buffer,
         pagesize=A4,
-        leftMargin=20 * mm,
-        rightMargin=20 * mm,
-        topMargin=20 * mm,
-        bottomMargin=20 * mm,
+        leftMargin=_PAGE_MARGIN,
+        rightMargin=_PAGE_MARGIN,
+        topMargin=_PAGE_MARGIN,
+        bottomMargin=_PAGE_MARGIN,
     )
     frame = Frame(
         doc.leftMargin,
@@ -87,7 +96,7 @@ def generate_career_sheet_pdf(
 
     # スタイル作成
     color_palette = _resolve_color_palette(options)
-    styles = _create_styles(font_name, color_palette)
+    styles = dict(_create_styles(font_name, color_palette))
 
     # Flowables作成
     flowables: list[Any] = []
@@ -103,10 +112,50 @@ def generate_career_sheet_pdf(
             _create_qualifications_section(rirekisho_data["qualifications"], styles, color_palette)
         )
 
-    # 本文（Markdown）
-    decorations = {
+    # 本文（Markdown）。空の場合は装飾設定も不要
+    if markdown_content and not markdown_content.isspace():
+        decorations = _create_markdown_decorations(color_palette)
+        flowables.extend(_create_section_break(decorations["heading2_rule"]))
+        flowables.extend(markdown_to_flowables(markdown_content, styles, decorations))
+
+    # PDF生成
+    doc.build(flowables)
+    write_bytes_atomic(output_path, buffer.getvalue())
+
+
+@dataclass(frozen=True, slots=True)
+class _Palette:
+    """職務経歴書のカラーパレット（ハッシュ可能なため、そのままキャッシュキーに使える）"""
+
+    body_text: colors.Color
+    main: colors.Color
+    sub: colors.Color
+    accent: colors.Color
+
+
+def _resolve_color_palette(options: dict[str, Any]) -> _Palette:
+    """カラー設定を解決（未指定はデフォルト）"""
+    resolved = resolve_style_colors(options.get("styles"))
+    return _parse_color_palette(**resolved)
+
+
+@lru_cache(maxsize=8)
+def _parse_color_palette(body_text: str, main: str, sub: str, accent: str) -> _Palette:
+    """HEXカラー設定をColorに変換（同じ設定ではキャッシュを返す）"""
+    return _Palette(
+        body_text=colors.HexColor(body_text),
+        main=colors.HexColor(main),
+        sub=colors.HexColor(sub),
+        accent=colors.HexColor(accent),
+    )
+
+
+@lru_cache(maxsize=8)
+def _create_markdown_decorations(color_palette: _Palette) -> dict[str, Any]:
+    """Markdown本文の装飾設定を作成（共有されるため変更しないこと）"""
+    return {
         "heading2_bar": {
-            "background": color_palette["main"],
+            "background": color_palette.main,
             "padding_x": _SPACING_PT["heading_bar_padding_x"],
             "padding_y": _SPACING_PT["heading_bar_padding_y"],
             "space_before": _SPACING_PT["heading_bar_before"],
@@ -114,61 +163,54 @@ def generate_career_sheet_pdf(
         },
         "section_indent_step": _SPACING_MM["sm"],
         "heading2_rule": {
-            "color": color_palette["sub"],
+            "color": color_palette.sub,
             "thickness": 0.6,
             "space_before": _SPACING_PT["h2_rule_before"],
             "space_after": _SPACING_PT["h2_rule_after"],
         },
         "thematic_break": {
-            "color": color_palette["sub"],
+            "color": color_palette.sub,
             "thickness": 0.6,
             "space_before": _SPACING_PT["h2_rule_before"],
             "space_after": _SPACING_PT["h2_rule_after"],
         },
         "table": {
-            "header_background": color_palette["sub"],
-            "line_color": color_palette["sub"],
+            "header_background": color_palette.sub,
+            "line_color": color_palette.sub,
             "line_width": 0.5,
             "cell_padding": _SPACING_MM["sm"],
         },
         "code_block": {
-            "background": color_palette["sub"],
+            "background": color_palette.sub,
             "left_indent": _SPACING_MM["sm"],
             "space_before": _SPACING_MM["sm"],
             "space_after": _SPACING_MM["sm"],
         },
         "blockquote": {
             "indent": _SPACING_MM["md"],
-            "text_color": color_palette["body_text"],
+            "text_color": color_palette.body_text,
         },
     }
-    if markdown_content.strip():
-        flowables.extend(_create_section_break(decorations["heading2_rule"]))
-    flowables.extend(markdown_to_flowables(markdown_content, styles, decorations))
-
-    # PDF生成
-    doc.build(flowables)
-
-
-def _resolve_color_palette(options: dict[str, Any]) -> dict[str, colors.Color]:
-    """カラー設定を解決（未指定はデフォルト）"""
-    resolved = resolve_style_colors(options.get("styles"))
-    return {key: colors.HexColor(value) for key, value in resolved.items()}
 
 
+@lru_cache(maxsize=8)
 def _create_styles(
     font_name: str,
-    palette: dict[str, colors.Color],
+    palette: _Palette,
 ) -> dict[str, ParagraphStyle]:
-    """スタイルシート作成（視認性重視のデザイン）"""
-    return {
+    """スタイルシート作成（視認性重視のデザイン）
+
+    フォントとカラーパレットが同じならキャッシュ済みのスタイルを返すため、
+    呼び出し側は辞書を複製して使うこと。
+    """
+    styles = {
         "Title": ParagraphStyle(
             "Title",
             fontName=font_name,
             fontSize=22,
             alignment=TA_CENTER,
             spaceAfter=_SPACING_PT["title_after"],
-            textColor=palette["main"],
+            textColor=palette.main,
         ),
         "Heading1": ParagraphStyle(
             "Heading1",
@@ -178,12 +220,12 @@ def _create_styles(
             spaceAfter=_SPACING_PT["h1_after"],
             spaceBefore=_SPACING_PT["h1_before"],
             textColor=colors.white,
-            backColor=palette["main"],
+            backColor=palette.main,
             # Note: borderWidth=0で下線効果は無効化、underlineProportionも効果なし
             # 将来的に下線を追加する場合はborderWidthを設定
             borderWidth=0,
             borderPadding=0,
-            borderColor=palette["main"],
+            borderColor=palette.main,
             leftIndent=0,
             underlineProportion=0.15,
         ),
@@ -204,7 +246,7 @@ def _create_styles(
             alignment=TA_LEFT,
             spaceAfter=_SPACING_PT["h3_after"],
             spaceBefore=_SPACING_PT["h3_before"],
-            textColor=palette["body_text"],
+            textColor=palette.body_text,
             leftIndent=0,
         ),
         "Heading4": ParagraphStyle(
@@ -214,7 +256,7 @@ def _create_styles(
             alignment=TA_LEFT,
             spaceAfter=_SPACING_PT["h4_after"],
             spaceBefore=_SPACING_PT["h4_before"],
-            textColor=palette["main"],
+            textColor=palette.main,
             leftIndent=0,
         ),
         "Heading5": ParagraphStyle(
@@ -224,7 +266,7 @@ def _create_styles(
             alignment=TA_LEFT,
             spaceAfter=_SPACING_PT["h5_after"],
             spaceBefore=_SPACING_PT["h5_before"],
-            textColor=palette["main"],
+            textColor=palette.main,
             leftIndent=0,
         ),
         "Heading6": ParagraphStyle(
@@ -234,7 +276,7 @@ def _create_styles(
             alignment=TA_LEFT,
             spaceAfter=_SPACING_PT["h6_after"],
             spaceBefore=_SPACING_PT["h6_before"],
-            textColor=palette["main"],
+            textColor=palette.main,
             leftIndent=0,
         ),
         "Heading7": ParagraphStyle(
@@ -244,7 +286,7 @@ def _create_styles(
             alignment=TA_LEFT,
             spaceAfter=_SPACING_PT["h7_after"],
             spaceBefore=_SPACING_PT["h7_before"],
-            textColor=palette["main"],
+            textColor=palette.main,
             leftIndent=0,
         ),
         "BodyText": ParagraphStyle(
@@ -254,7 +296,7 @@ def _create_styles(
             alignment=TA_LEFT,
             leading=_BODY_LEADING_PT,
             spaceAfter=_SPACING_PT["body_after"],
-            textColor=palette["body_text"],
+            textColor=palette.body_text,
         ),
         "Bullet": ParagraphStyle(
             "Bullet",
@@ -265,50 +307,57 @@ def _create_styles(
             firstLineIndent=-_INDENT_MM["bullet_hanging"],
             leading=15,
             spaceAfter=_SPACING_MM["xs"],
-            textColor=palette["body_text"],
+            textColor=palette.body_text,
         ),
         "Header": ParagraphStyle(
             "Header",
             fontName=font_name,
             fontSize=9,
             alignment=TA_LEFT,
-            textColor=palette["body_text"],
+            textColor=palette.body_text,
         ),
         "NameHeader": ParagraphStyle(
             "NameHeader",
             fontName=font_name,
             fontSize=16,
             alignment=TA_LEFT,
-            textColor=palette["body_text"],
+            textColor=palette.body_text,
         ),
     }
+    # ヘッダーの作成日（右寄せ）
+    styles["DateStyle"] = ParagraphStyle(
+        "DateStyle",
+        parent=styles["BodyText"],
+        fontSize=9,
+        alignment=TA_RIGHT,
+    )
+    # 構造データ側のセクション見出し（HeadingBar）用。余白はHeadingBar側で持つ
+    styles["Heading2Bar"] = ParagraphStyle(
+        "Heading2Bar",
+        parent=styles["Heading2"],
+        spaceBefore=0,
+        spaceAfter=0,
+        leading=styles["Heading2"].fontSize,
+    )
+    return styles
 
 
 def _create_header(
     rirekisho_data: dict[str, Any],
     styles: dict[str, ParagraphStyle],
-    palette: dict[str, colors.Color],
+    palette: _Palette,
 ) -> list[Any]:
     """ヘッダー（個人情報・連絡先）作成（視認性重視）"""
     flowables: list[Any] = []
 
     # タイトル
-    flowables.append(Paragraph("職務経歴書", styles["Title"]))
+    flowables.append(_plain_paragraph("職務経歴書", styles["Title"]))
 
     # 日付（右寄せ、date_formatオプションに対応）
-    from datetime import datetime
-
     now = datetime.now()
     date_formatter = get_generation_context().date_formatter
     date_text = f"{date_formatter.format(now.strftime('%Y-%m-%d'))} 現在"
-
-    date_style = ParagraphStyle(
-        "DateStyle",
-        parent=styles["BodyText"],
-        fontSize=9,
-        alignment=TA_RIGHT,
-    )
-    flowables.append(Paragraph(date_text, date_style))
+    flowables.append(_plain_paragraph(date_text, styles["DateStyle"]))
     flowables.append(Spacer(1, _SPACING_MM["sm"]))
 
     # 個人情報（氏名を強調）
@@ -324,35 +373,20 @@ def _create_header(
 
     # 連絡先情報をシンプルなテーブルで
     contact_data = [
-        [f"氏名: {name}".strip(), f"電話: {phone}".strip()],
-        [f"生年月日: {birthdate}".strip(), f"メール: {email}".strip()],
+        [_contact_cell("氏名", name), _contact_cell("電話", phone)],
+        [_contact_cell("生年月日", birthdate), _contact_cell("メール", email)],
     ]
 
     contact_table = Table(
         contact_data,
-        colWidths=[85 * mm, 85 * mm],
-        rowHeights=[_SPACING_MM["xl"], _SPACING_MM["xl"]],
+        colWidths=_CONTACT_COLUMN_WIDTHS,
+        rowHeights=_CONTACT_ROW_HEIGHTS,
     )
 
+    body_style = styles["BodyText"]
     contact_table.setStyle(
-        TableStyle(
-            [
-                (
-                    "FONT",
-                    (0, 0),
-                    (-1, -1),
-                    styles["BodyText"].fontName,
-                    styles["BodyText"].fontSize,
-                ),
-                ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-                ("TEXTCOLOR", (0, 0), (-1, -1), styles["BodyText"].textColor),
-                ("LINEBELOW", (0, 0), (-1, -1), 0.5, palette["sub"]),
-                ("LEFTPADDING", (0, 0), (-1, -1), _SPACING_MM["md"]),
-                ("RIGHTPADDING", (0, 0), (-1, -1), _SPACING_MM["md"]),
-                ("TOPPADDING", (0, 0), (-1, -1), _SPACING_MM["sm"]),
-                ("BOTTOMPADDING", (0, 0), (-1, -1), _SPACING_MM["sm"]),
-            ]
+        _contact_table_style(
+            body_style.fontName, body_style.fontSize, body_style.textColor, palette.sub
         )
     )
 
@@ -362,31 +396,72 @@ def _create_header(
     return flowables
 
 
+def _contact_cell(label: str, value: str) -> str:
+    """連絡先セルの文字列（値が空なら「ラベル:」のみ）"""
+    value = value.rstrip()
+    return f"{label}: {value}" if value else f"{label}:"
+
+
+@lru_cache(maxsize=8)
+def _contact_table_style(
+    font_name: str,
+    font_size: float,
+    text_color: colors.Color,
+    line_color: colors.Color,
+) -> TableStyle:
+    """連絡先テーブルのスタイル（Table.setStyleはコマンドを複製するため共有して使える）"""
+    return TableStyle(
+        [
+            ("FONT", (0, 0), (-1, -1), font_name, font_size),
+            ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+            ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+            ("TEXTCOLOR", (0, 0), (-1, -1), text_color),
+            ("LINEBELOW", (0, 0), (-1, -1), 0.5, line_color),
+            ("LEFTPADDING", (0, 0), (-1, -1), _SPACING_MM["md"]),
+            ("RIGHTPADDING", (0, 0), (-1, -1), _SPACING_MM["md"]),
+            ("TOPPADDING", (0, 0), (-1, -1), _SPACING_MM["sm"]),
+            ("BOTTOMPADDING", (0, 0), (-1, -1), _SPACING_MM["sm"]),
+        ]
+    )
+
+
 def _create_qualifications_section(
     qualifications: list[dict[str, Any]],
     styles: dict[str, ParagraphStyle],
-    palette: dict[str, colors.Color],
+    palette: _Palette,
 ) -> list[Any]:
     """免許・資格セクション作成"""
     flowables: list[Any] = []
 
     flowables.extend(_create_section_heading("免許・資格", styles, palette))
 
-    date_formatter = get_generation_context().date_formatter
-    for qual in qualifications:
-        date_str = date_formatter.format_or_raw(qual.get("date", ""), format_style="full")
-        name = qual.get("name", "")
-        flowables.append(Paragraph(f"• {date_str} {name}".strip(), styles["Bullet"]))
+    bullet_style = styles["Bullet"]
+    format_date = get_generation_context().date_formatter.format_or_raw
+    rows = (
+        (format_date(qual.get("date", ""), format_style="full"), qual.get("name", ""))
+        for qual in qualifications
+    )
+    flowables.extend(
+        _plain_paragraph(f"• {date_str} {name}".strip(), bullet_style) for date_str, name in rows
+    )
 
     flowables.append(Spacer(1, _SPACING_MM["xxl"]))
 
     return flowables
 
 
+def _plain_paragraph(text: str, style: ParagraphStyle) -> Paragraph:
+    """マークアップを含まない文字列からParagraphを作成
+
+    データ由来の「&」「<」「>」はエスケープし、タグ・実体参照として解釈させずにそのまま描画する。
+    """
+    return Paragraph(escape(text), style)
+
+
 def _create_section_heading(
     title: str,
     styles: dict[str, ParagraphStyle],
-    palette: dict[str, colors.Color],
+    palette: _Palette,
 ) -> list[Any]:
     """共通セクション見出し（H2相当）"""
     flowables: list[Any] = []
@@ -401,7 +476,7 @@ def _create_section_break(rule: dict[str, Any]) -> list[Any]:
         HRFlowable(
             width="100%",
             thickness=float(rule.get("thickness", 0.6)),
-            color=rule.get("color", colors.HexColor("#cdc69c")),
+            color=rule.get("color", _DEFAULT_RULE_COLOR),
             spaceBefore=float(rule.get("space_before", _SPACING_MM["md"])),
             spaceAfter=float(rule.get("space_after", _SPACING_MM["md"])),
         )
@@ -412,19 +487,12 @@ def _create_section_break(rule: dict[str, Any]) -> list[Any]:
 def _create_heading_bar(
     text: str,
     styles: dict[str, ParagraphStyle],
-    palette: dict[str, colors.Color],
+    palette: _Palette,
 ) -> HeadingBar:
-    bar_style = ParagraphStyle(
-        "Heading2Bar",
-        parent=styles["Heading2"],
-        spaceBefore=0,
-        spaceAfter=0,
-        leading=styles["Heading2"].fontSize,
-    )
     return HeadingBar(
         text=text,
-        style=bar_style,
-        background=palette["main"],
+        style=styles["Heading2Bar"],
+        background=palette.main,
         padding_x=_SPACING_PT["heading_bar_padding_x"],
         padding_y=_SPACING_PT["heading_bar_padding_y"],
         space_before=_SPACING_PT["heading_bar_before"],
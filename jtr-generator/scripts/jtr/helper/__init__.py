@@ -1,10 +1,16 @@
 """共通ヘルパー群。"""
 
-from .config import load_config, resolve_font_paths, resolve_style_colors
-from .fonts import find_default_font, register_font
-from .generation_context import get_generation_context, init_generation_context
-from .japanese_era import JapaneseDateFormatter, convert_to_wareki
-from .paths import get_assets_path, get_layout_path, get_schema_path, get_skill_root
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .config import load_config, resolve_font_paths, resolve_style_colors
+    from .fonts import find_default_font, register_font
+    from .generation_context import get_generation_context, init_generation_context
+    from .japanese_era import JapaneseDateFormatter, convert_to_wareki
+    from .paths import get_assets_path, get_layout_path, get_schema_path, get_skill_root
 
 __all__ = [
     "load_config",
@@ -21,3 +27,29 @@ __all__ = [
     "get_schema_path",
     "get_skill_root",
 ]
+
+# 公開名と定義モジュールの対応。fontsはreportlabを読み込むため、初回アクセス時に読み込む（PEP 562）
+_EXPORTS = {
+    "load_config": ".config",
+    "resolve_font_paths": ".config",
+    "resolve_style_colors": ".config",
+    "find_default_font": ".fonts",
+    "register_font": ".fonts",
+    "get_generation_context": ".generation_context",
+    "init_generation_context": ".generation_context",
+    "JapaneseDateFormatter": ".japanese_era",
+    "convert_to_wareki": ".japanese_era",
+    "get_assets_path": ".paths",
+    "get_layout_path": ".paths",
+    "get_schema_path": ".paths",
+    "get_skill_root": ".paths",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -1,5 +1,7 @@
 """設定ファイル読み込みとフォントパス解決"""
 
+import copy
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -7,6 +9,11 @@ import yaml
 
 from .paths import get_assets_path
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - libyaml無しでビルドされたPyYAML
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 DEFAULT_STYLE_COLORS = {
     "body_text": "#050315",
     "main": "#6761af",
@@ -32,14 +39,21 @@ def load_config(config_path: Path | None = None) -> dict[str, Any]:
         # デフォルト設定を返す
         return {"options": {"date_format": "seireki", "paper_size": "A4"}, "fonts": {}}
 
+    # 呼び出し側（resolve_font_paths等）が辞書を書き換えてもキャッシュに影響しないよう複製を返す
+    stat = config_path.stat()
+    return copy.deepcopy(_load_config_file(config_path, stat.st_mtime_ns, stat.st_size))
+
+
+@lru_cache(maxsize=4)
+def _load_config_file(config_path: Path, mtime_ns: int, size: int) -> dict[str, Any]:
+    # 更新時刻とサイズをキーに含め、ファイルが変更された場合は読み直す
     try:
-        with open(config_path, encoding="utf-8") as f:
-            loaded = yaml.safe_load(f)
-            if not isinstance(loaded, dict):
-                return {"options": {}, "fonts": {}}
-            return loaded
+        loaded = yaml.load(config_path.read_bytes(), Loader=_YamlLoader)  # noqa: S506 - SafeLoaderと同等
     except yaml.YAMLError as e:
         raise ValueError(f"config.yamlの読み込みに失敗しました: {e}") from e
+    if not isinstance(loaded, dict):
+        return {"options": {}, "fonts": {}}
+    return loaded
 
 
 def resolve_font_paths(config: dict[str, Any]) -> dict[str, Any]:
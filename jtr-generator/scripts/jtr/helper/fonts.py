@@ -3,11 +3,18 @@
 rirekisho_generator.py と layout/metrics.py で重複していたフォント登録処理を統一します。
 """
 
+from functools import cache
 from pathlib import Path
+from threading import Lock
 
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 
+# このモジュール経由で登録したフォント名 → 登録元ファイルのパス
+_REGISTERED_FONTS: dict[str, Path] = {}
+# 並列生成時に同じフォントを二重に解析・登録しないよう、登録処理を直列化する
+_REGISTER_LOCK = Lock()
+
 
 def register_font(font_path: Path) -> str:
     """TrueTypeフォントをReportLabに登録
@@ -25,10 +32,29 @@ def register_font(font_path: Path) -> str:
         raise FileNotFoundError(f"フォントファイルが見つかりません: {font_path}")
 
     font_name = font_path.stem
-    pdfmetrics.registerFont(TTFont(font_name, str(font_path)))
+    if _is_registered(font_name, font_path):
+        return font_name
+
+    with _REGISTER_LOCK:
+        # ロック待ちの間に他のスレッドが登録済みにしている場合がある
+        if not _is_registered(font_name, font_path):
+            pdfmetrics.registerFont(TTFont(font_name, str(font_path)))
+            _REGISTERED_FONTS[font_name] = font_path
     return font_name
 
 
+def _is_registered(font_name: str, font_path: Path) -> bool:
+    """同じファイルが同じ名前で登録済みか（数MBあるTTFの再解析を省略するため）
+
+    Note:
+        getRegisteredFontNames() は呼び出しごとにソート済みリストを生成するため使わず、
+        pdfmetrics の登録辞書を直接O(1)で参照します（pdfmetrics側から登録が消えている場合は
+        登録し直す）。_fonts は reportlab 4.x〜5.0 で確認済み。
+    """
+    return _REGISTERED_FONTS.get(font_name) == font_path and font_name in pdfmetrics._fonts
+
+
+@cache
 def find_default_font() -> Path:
     """デフォルトフォント（BIZ UDMincho）のパスを取得
 
@@ -37,6 +63,10 @@ def find_default_font() -> Path:
 
     Raises:
         FileNotFoundError: フォントファイルが存在しない場合
+
+    Note:
+        同梱フォントはプロセス中に変わらないため、ディレクトリ走査の結果をキャッシュします。
+        見つからなかった場合（例外）はキャッシュされません。
     """
     from .paths import get_assets_path
 
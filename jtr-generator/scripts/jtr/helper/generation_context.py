@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from contextvars import ContextVar
 from dataclasses import dataclass
 from typing import Any, Literal, cast
 
@@ -16,7 +17,8 @@ class GenerationContext:
     date_formatter: JapaneseDateFormatter
 
 
-_CONTEXT: GenerationContext | None = None
+# スレッド/タスクごとに独立したコンテキストを持たせる（並列生成時の競合を避ける）
+_CONTEXT: ContextVar[GenerationContext | None] = ContextVar("_CONTEXT", default=None)
 
 
 def init_generation_context(options: dict[str, Any]) -> GenerationContext:
@@ -32,11 +34,11 @@ def init_generation_context(options: dict[str, Any]) -> GenerationContext:
 
 
 def set_generation_context(context: GenerationContext) -> None:
-    global _CONTEXT
-    _CONTEXT = context
+    _CONTEXT.set(context)
 
 
 def get_generation_context() -> GenerationContext:
-    if _CONTEXT is None:
+    context = _CONTEXT.get()
+    if context is None:
         raise RuntimeError("Generation context is not initialized.")
-    return _CONTEXT
+    return context
@@ -1,54 +1,104 @@
 """和暦変換ユーティリティ"""
 
-from datetime import date, datetime
+from bisect import bisect_right
+from collections.abc import Callable
+from functools import lru_cache
 from typing import Literal
 
-# 年号の定義（開始日、年号名、略称）
+_VALID_STYLES = frozenset({"full", "short"})
+_VALID_DATE_FORMATS = frozenset({"seireki", "wareki"})
+
+# 同一日付の繰り返し整形を吸収するキャッシュサイズ
+_FORMAT_CACHE_SIZE = 2048
+
+# 年号の定義（開始年, 開始月, 開始日, 年号名, 略称）
 _ERA_DEFINITIONS = [
-    (date(2019, 5, 1), "令和", "R"),
-    (date(1989, 1, 8), "平成", "H"),
-    (date(1926, 12, 25), "昭和", "S"),
+    (2019, 5, 1, "令和", "R"),
+    (1989, 1, 8, "平成", "H"),
+    (1926, 12, 25, "昭和", "S"),
 ]
 
+# 平年の各月の日数
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _pack_date(year: int, month: int, day: int) -> int:
+    """年月日を YYYYMMDD 形式の整数に詰める（大小比較が日付順と一致する）"""
+    return year * 10000 + month * 100 + day
+
 
-def _parse_date_string(date_str: str) -> tuple[date, bool]:
+# bisect用に開始日の昇順へ並べ替えた検索テーブル
+_ERA_START_KEYS = tuple(_pack_date(y, m, d) for y, m, d, _, _ in reversed(_ERA_DEFINITIONS))
+_ERA_META = tuple((name, abbrev, y) for y, _, _, name, abbrev in reversed(_ERA_DEFINITIONS))
+
+
+def _parse_date_string(date_str: str) -> tuple[int, int, int, bool]:
     """
-    日付文字列をパースしてdateオブジェクトと月のみフラグを返す
+    日付文字列をパースして年・月・日と月のみフラグを返す
 
     Args:
         date_str: YYYY-MM-DD または YYYY-MM 形式の日付文字列
 
     Returns:
-        (dateオブジェクト, 月のみフラグ)
+        (年, 月, 日, 月のみフラグ) ※月のみの場合、日は1
 
     Raises:
         ValueError: 無効な日付形式
     """
-    # YYYY-MM-DD形式
-    if len(date_str) == 10 and date_str[4] == "-" and date_str[7] == "-":
-        try:
-            parsed_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-            return (parsed_date, False)
-        except ValueError as e:
-            raise ValueError(f"Invalid date value: {date_str}") from e
+    length = len(date_str)
+    if length not in (7, 10) or date_str[4] != "-" or (length == 10 and date_str[7] != "-"):
+        raise ValueError(f"Invalid date format: {date_str}. Expected YYYY-MM-DD or YYYY-MM format.")
+
+    # 固定長フォーマットのため、strptimeを介さずフィールドを直接切り出す
+    year_str = date_str[0:4]
+    month_str = date_str[5:7]
+    day_str = date_str[8:10] if length == 10 else "01"
+    # isdigit()は「①」「²」等の非ASCII数字も受け付けるため、ASCIIに限定する
+    digits = year_str + month_str + day_str
+    if not (digits.isascii() and digits.isdigit()):
+        raise ValueError(f"Invalid date value: {date_str}")
+
+    year = int(year_str)
+    month = int(month_str)
+    day = int(day_str)
+    # datetime.dateと同じ範囲検証をオブジェクト生成なしで行う
+    if year < 1 or not 1 <= month <= 12:
+        raise ValueError(f"Invalid date value: {date_str}")
+    days_in_month = _DAYS_IN_MONTH[month - 1]
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        days_in_month = 29
+    if not 1 <= day <= days_in_month:
+        raise ValueError(f"Invalid date value: {date_str}")
+    return (year, month, day, length == 7)
+
+
+def parse_date_ymd(date_str: str) -> tuple[int, int, int]:
+    """
+    YYYY-MM-DD 形式の日付文字列を (年, 月, 日) に分解
 
-    # YYYY-MM形式
-    if len(date_str) == 7 and date_str[4] == "-":
-        try:
-            parsed_date = datetime.strptime(date_str + "-01", "%Y-%m-%d").date()
-            return (parsed_date, True)
-        except ValueError as e:
-            raise ValueError(f"Invalid date value: {date_str}") from e
+    Args:
+        date_str: YYYY-MM-DD 形式の日付文字列
 
-    raise ValueError(f"Invalid date format: {date_str}. Expected YYYY-MM-DD or YYYY-MM format.")
+    Returns:
+        (年, 月, 日)
 
+    Raises:
+        ValueError: 無効な日付形式（YYYY-MM形式を含む）
+    """
+    if len(date_str) != 10:
+        raise ValueError(f"Invalid date format: {date_str}. Expected YYYY-MM-DD format.")
+    year, month, day, _ = _parse_date_string(date_str)
+    return (year, month, day)
 
-def _get_era_info(target_date: date) -> tuple[str, str, int]:
+
+def _get_era_info(year: int, month: int, day: int) -> tuple[str, str, int]:
     """
     指定日付の年号情報を取得
 
     Args:
-        target_date: 対象日付
+        year: 西暦年
+        month: 月
+        day: 日
 
     Returns:
         (年号名, 略称, 和暦年)
@@ -56,17 +106,20 @@ def _get_era_info(target_date: date) -> tuple[str, str, int]:
     Raises:
         ValueError: 対応していない年号範囲
     """
-    for era_start, era_name, era_abbrev in _ERA_DEFINITIONS:
-        if target_date >= era_start:
-            # 和暦年を計算
-            wareki_year = target_date.year - era_start.year + 1
-            return (era_name, era_abbrev, wareki_year)
+    index = bisect_right(_ERA_START_KEYS, _pack_date(year, month, day)) - 1
+    if index < 0:
+        raise ValueError(
+            f"Unsupported era: {year:04d}-{month:02d}-{day:02d}. "
+            "Only dates from Showa (1926-12-25) onwards are supported."
+        )
 
-    raise ValueError(
-        f"Unsupported era: {target_date}. Only dates from Showa (1926-12-25) onwards are supported."
-    )
+    era_name, era_abbrev, start_year = _ERA_META[index]
+    # 和暦年を計算
+    wareki_year = year - start_year + 1
+    return (era_name, era_abbrev, wareki_year)
 
 
+@lru_cache(maxsize=_FORMAT_CACHE_SIZE)
 def convert_to_wareki(date_str: str, format: Literal["full", "short"] = "full") -> str:
     """
     西暦日付を和暦に変換
@@ -94,30 +147,33 @@ def convert_to_wareki(date_str: str, format: Literal["full", "short"] = "full")
         '令和元年5月1日'
     """
     # formatパラメータの検証
-    if format not in {"full", "short"}:
+    if format not in _VALID_STYLES:
         raise ValueError(f"Invalid format parameter: {format}. Expected 'full' or 'short'.")
 
     # 日付文字列をパース
-    parsed_date, month_only = _parse_date_string(date_str)
+    year, month, day, month_only = _parse_date_string(date_str)
 
     # 年号情報を取得
-    era_name, era_abbrev, wareki_year = _get_era_info(parsed_date)
+    era_name, era_abbrev, wareki_year = _get_era_info(year, month, day)
 
-    # 元年表記
-    year_display = "元" if wareki_year == 1 else str(wareki_year)
+    month_text = str(month)
 
-    # フォーマットに応じて出力
+    # フォーマットに応じて部品を組み立てて連結
+    parts: tuple[str, ...]
     if format == "full":
-        if month_only:
-            return f"{era_name}{year_display}年{parsed_date.month}月"
-        return f"{era_name}{year_display}年{parsed_date.month}月{parsed_date.day}日"
-    # short
-    year_display_short = "1" if wareki_year == 1 else str(wareki_year)
-    if month_only:
-        return f"{era_abbrev}{year_display_short}.{parsed_date.month}"
-    return f"{era_abbrev}{year_display_short}.{parsed_date.month}.{parsed_date.day}"
-
-
+        # 元年表記
+        year_display = "元" if wareki_year == 1 else str(wareki_year)
+        parts = (era_name, year_display, "年", month_text, "月")
+        if not month_only:
+            parts += (str(day), "日")
+    else:
+        parts = (era_abbrev, str(wareki_year), ".", month_text)
+        if not month_only:
+            parts += (".", str(day))
+    return "".join(parts)
+
+
+@lru_cache(maxsize=_FORMAT_CACHE_SIZE)
 def format_seireki_japanese(
     date_str: str,
     format_style: Literal["full", "short"] = "full",
@@ -135,20 +191,21 @@ def format_seireki_japanese(
     Raises:
         ValueError: 無効な日付形式
     """
-    if format_style not in {"full", "short"}:
+    if format_style not in _VALID_STYLES:
         raise ValueError(f"Invalid format_style: {format_style}. Expected 'full' or 'short'.")
 
-    parsed_date, month_only = _parse_date_string(date_str)
+    year, month, day, month_only = _parse_date_string(date_str)
 
     if month_only:
         if format_style == "short":
-            return f"{parsed_date.year}.{parsed_date.month}"
-        return f"{parsed_date.year}年{parsed_date.month}月"
+            return f"{year}.{month}"
+        return f"{year}年{month}月"
     if format_style == "short":
-        return f"{parsed_date.year}.{parsed_date.month}.{parsed_date.day}"
-    return f"{parsed_date.year}年{parsed_date.month}月{parsed_date.day}日"
+        return f"{year}.{month}.{day}"
+    return f"{year}年{month}月{day}日"
 
 
+@lru_cache(maxsize=_FORMAT_CACHE_SIZE)
 def format_japanese_date(
     date_str: str,
     date_format: Literal["seireki", "wareki"],
@@ -210,18 +267,22 @@ class JapaneseDateFormatter:
         *,
         default_format_style: Literal["full", "short"] = "full",
     ) -> None:
-        if date_format not in {"seireki", "wareki"}:
+        if date_format not in _VALID_DATE_FORMATS:
             raise ValueError(f"Invalid date_format: {date_format}. Expected 'seireki' or 'wareki'")
-        if default_format_style not in {"full", "short"}:
+        if default_format_style not in _VALID_STYLES:
             raise ValueError(
                 f"Invalid default_format_style: {default_format_style}. Expected 'full' or 'short'"
             )
         self._date_format = date_format
         self._default_format_style = default_format_style
+        # date_formatは生成後に変わらないため、呼び出し先の整形関数をここで確定する
+        # （どちらも (date_str, style) の位置引数で呼べる）
+        self._format_fn: Callable[[str, Literal["full", "short"]], str] = (
+            convert_to_wareki if date_format == "wareki" else format_seireki_japanese
+        )
 
     def format(self, date_str: str, format_style: Literal["full", "short"] | None = None) -> str:
-        style = format_style or self._default_format_style
-        return format_japanese_date(date_str, self._date_format, format_style=style)
+        return self._format_fn(date_str, format_style or self._default_format_style)
 
     def format_or_raw(
         self, date_str: str, format_style: Literal["full", "short"] | None = None
@@ -0,0 +1,33 @@
+"""出力ファイル書き込みの共通化モジュール"""
+
+import os
+import secrets
+from pathlib import Path
+
+# 一時ファイルは新規作成に限定する（同名ファイルがあれば上書きせずに失敗させる）
+_TMP_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+
+
+def write_bytes_atomic(path: Path, data: bytes) -> None:
+    """一時ファイルに書き込んでから出力先を置き換える
+
+    Args:
+        path: 出力先ファイルパス
+        data: 書き込むバイト列
+
+    Note:
+        一時ファイルは出力先と同じディレクトリに書き込みごとに一意な名前で作成し、
+        os.replace で置き換えます。同じ出力先へ複数プロセスが同時に書き込んでも、
+        互いの一時ファイルを上書き・削除しません。
+        パーミッションは通常のファイル作成と同じくumaskに従います（mkstempの0600にはしない）。
+        書き込みに失敗した場合は一時ファイルを削除し、既存の出力先には手を付けません。
+    """
+    tmp_path = path.with_name(f".{path.name}.{secrets.token_hex(8)}.tmp")
+    fd = os.open(tmp_path, _TMP_OPEN_FLAGS, 0o666)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
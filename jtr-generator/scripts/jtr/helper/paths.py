@@ -3,9 +3,11 @@
 jtr-generator/ ディレクトリとassets/配下のパスを一元管理します。
 """
 
+from functools import cache
 from pathlib import Path
 
 
+@cache
 def get_skill_root() -> Path:
     """jtr-generator/ ディレクトリのルートパスを取得
 
@@ -19,10 +21,13 @@ def get_skill_root() -> Path:
         - parents[1]: jtr-generator/scripts/jtr/
         - parents[2]: jtr-generator/scripts/
         - parents[3]: jtr-generator/
+
+        resolve() はファイルシステムを参照するため、結果はプロセス内でキャッシュします。
     """
     return Path(__file__).resolve().parents[3]
 
 
+@cache
 def get_assets_path(*parts: str) -> Path:
     """assets/配下のパスを取得
 
@@ -37,6 +42,9 @@ def get_assets_path(*parts: str) -> Path:
         PosixPath('/path/to/jtr-generator/assets/config.yaml')
         >>> get_assets_path("fonts", "BIZ_UDMincho", "BIZUDMincho-Regular.ttf")
         PosixPath('/path/to/jtr-generator/assets/fonts/BIZ_UDMincho/BIZUDMincho-Regular.ttf')
+
+    Note:
+        Pathは不変なので、同じ引数に対しては生成済みのPathを再利用します。
     """
     return get_skill_root() / "assets" / Path(*parts)
 
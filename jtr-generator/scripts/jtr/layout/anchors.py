@@ -1,12 +1,34 @@
 from __future__ import annotations
 
-from typing import Any
+from bisect import bisect_left
+from collections.abc import Iterable
+from functools import cache
+from itertools import repeat
+from operator import add, sub
+from types import ModuleType
+from typing import Any, cast
+
+# これ未満の要素数ではNumPy配列化のオーバーヘッドが上回るため純Pythonで処理する
+_NUMPY_MIN_SIZE = 32
+
+
+@cache
+def _load_numpy() -> ModuleType | None:
+    # numpyはレイアウト生成ツール専用の任意依存。PDF生成時に読み込みコストを払わないよう初回利用時に読み込む
+    try:
+        import numpy
+    except ImportError:  # pragma: no cover - numpyは任意依存（配布パッケージには含めない）
+        return None
+    return numpy
 
 
 def _cluster_positions(values: list[float], tol: float) -> list[float]:
     if not values:
         return []
 
+    if len(values) >= _NUMPY_MIN_SIZE and (np := _load_numpy()) is not None:
+        return _cluster_positions_numpy(np, values, tol)
+
     values = sorted(values)
     clusters: list[list[float]] = []
     for value in values:
@@ -18,18 +40,27 @@ def _cluster_positions(values: list[float], tol: float) -> list[float]:
     return [round(sum(cluster) / len(cluster), 3) for cluster in clusters]
 
 
+def _cluster_positions_numpy(np: ModuleType, values: list[float], tol: float) -> list[float]:
+    ordered = np.sort(np.asarray(values, dtype=np.float64))
+    bounds = np.concatenate(([0], np.nonzero(np.diff(ordered) > tol)[0] + 1, [ordered.size]))
+    # 平均は純Python版と同じsum()で計算し、丸め境界での結果を一致させる
+    sorted_values = ordered.tolist()
+    edges = bounds.tolist()
+    return [
+        round(sum(sorted_values[start:end]) / (end - start), 3)
+        for start, end in zip(edges, edges[1:], strict=False)
+    ]
+
+
 def _collect_line_positions(lines: list[dict[str, Any]], axis: str, tol: float) -> list[float]:
     if axis not in {"x", "y"}:
         raise ValueError("axis must be 'x' or 'y'")
 
-    positions: list[float] = []
-    for line in lines:
-        if axis == "x":
-            if abs(line["x0"] - line["x1"]) <= 0.01:
-                positions.append(float(line["x0"]))
-        else:
-            if abs(line["y0"] - line["y1"]) <= 0.01:
-                positions.append(float(line["y0"]))
+    # 軸の判定はループの外で一度だけ行う
+    start_key, end_key = ("x0", "x1") if axis == "x" else ("y0", "y1")
+    positions = [
+        float(line[start_key]) for line in lines if -0.01 <= line[start_key] - line[end_key] <= 0.01
+    ]
 
     return _cluster_positions(positions, tol=tol)
 
@@ -37,7 +68,40 @@ def _collect_line_positions(lines: list[dict[str, Any]], axis: str, tol: float)
 def _nearest_position(value: float, positions: list[float]) -> float:
     if not positions:
         raise ValueError("No line positions found")
-    return min(positions, key=lambda pos: abs(pos - value))
+    # positionsは_cluster_positionsの出力（昇順）。等距離の場合は小さい方を返す
+    index = bisect_left(positions, value)
+    if index == 0:
+        return positions[0]
+    if index == len(positions):
+        return positions[-1]
+    before = positions[index - 1]
+    after = positions[index]
+    return before if value - before <= after - value else after
+
+
+def _nearest_positions(values: list[float], positions: list[float]) -> list[float]:
+    if not values:
+        return []
+    if not positions:
+        raise ValueError("No line positions found")
+    np = _load_numpy() if len(values) >= _NUMPY_MIN_SIZE else None
+    if np is None:
+        return [_nearest_position(value, positions) for value in values]
+
+    # _nearest_positionと同じ規則（bisect_left + 等距離なら小さい方）を一括で適用
+    targets = np.asarray(values, dtype=np.float64)
+    candidates = np.asarray(positions, dtype=np.float64)
+    index = np.searchsorted(candidates, targets)
+    last = candidates.size - 1
+    before = candidates[np.clip(index - 1, 0, last)]
+    after = candidates[np.clip(index, 0, last)]
+    nearest = np.where(np.abs(targets - before) <= np.abs(after - targets), before, after)
+    return cast(list[float], nearest.tolist())
+
+
+def _round_all(values: Iterable[float], ndigits: int = 3) -> list[float]:
+    # 列単位でまとめて丸める（np.roundは組み込みround()と丸め境界の扱いが異なるため使わない）
+    return list(map(round, values, repeat(ndigits)))
 
 
 def build_text_anchors(
@@ -48,23 +112,29 @@ def build_text_anchors(
     v_positions = _collect_line_positions(lines, axis="x", tol=tol)
     h_positions = _collect_line_positions(lines, axis="y", tol=tol)
 
-    anchors: list[dict[str, Any]] = []
-    for text in texts:
-        x_ref = _nearest_position(float(text["x"]), v_positions)
-        y_ref = _nearest_position(float(text["y"]), h_positions)
+    xs = [float(text["x"]) for text in texts]
+    ys = [float(text["y"]) for text in texts]
+    x_refs = _nearest_positions(xs, v_positions)
+    y_refs = _nearest_positions(ys, h_positions)
+    dxs = _round_all(map(sub, xs, x_refs))
+    dys = _round_all(map(sub, ys, y_refs))
 
+    anchors: list[dict[str, Any]] = []
+    for text, x_line, y_line, dx, dy in zip(
+        texts, _round_all(x_refs), _round_all(y_refs), dxs, dys, strict=True
+    ):
         anchors.append(
             {
                 "text": text["text"],
                 "font_size": text["font_size"],
                 "align": text.get("align", "left"),
                 "anchor": {
-                    "x_line": round(x_ref, 3),
-                    "y_line": round(y_ref, 3),
+                    "x_line": x_line,
+                    "y_line": y_line,
                 },
                 "offset": {
-                    "dx": round(float(text["x"]) - x_ref, 3),
-                    "dy": round(float(text["y"]) - y_ref, 3),
+                    "dx": dx,
+                    "dy": dy,
                 },
                 "reference_position": {
                     "x": text["x"],
@@ -84,18 +154,23 @@ def resolve_texts_from_anchors(
     v_positions = _collect_line_positions(lines, axis="x", tol=tol)
     h_positions = _collect_line_positions(lines, axis="y", tol=tol)
 
-    resolved: list[dict[str, Any]] = []
-    for anchor in anchors:
-        x_line = _nearest_position(float(anchor["anchor"]["x_line"]), v_positions)
-        y_line = _nearest_position(float(anchor["anchor"]["y_line"]), h_positions)
-        dx = float(anchor["offset"]["dx"])
-        dy = float(anchor["offset"]["dy"])
+    x_lines = _nearest_positions(
+        [float(anchor["anchor"]["x_line"]) for anchor in anchors], v_positions
+    )
+    y_lines = _nearest_positions(
+        [float(anchor["anchor"]["y_line"]) for anchor in anchors], h_positions
+    )
 
+    xs = _round_all(map(add, x_lines, [float(anchor["offset"]["dx"]) for anchor in anchors]))
+    ys = _round_all(map(add, y_lines, [float(anchor["offset"]["dy"]) for anchor in anchors]))
+
+    resolved: list[dict[str, Any]] = []
+    for anchor, x, y in zip(anchors, xs, ys, strict=True):
         resolved.append(
             {
                 "text": anchor["text"],
-                "x": round(x_line + dx, 3),
-                "y": round(y_line + dy, 3),
+                "x": x,
+                "y": y,
                 "font_size": anchor["font_size"],
                 "align": anchor.get("align", "left"),
             }
@@ -13,12 +13,10 @@ SpacingRules = tuple[dict[str, float], dict[str, float], dict[str, float]]
 
 def load_career_sheet_spacing_rules() -> SpacingRules:
     rules_path = get_assets_path("data", "a4", "rules", "career_sheet_spacing.json")
-    if not rules_path.exists():
-        raise FileNotFoundError(f"余白ルールファイルが見つかりません: {rules_path}")
-
     try:
-        with open(rules_path, encoding="utf-8") as file:
-            loaded = json.load(file)
+        loaded = json.loads(rules_path.read_bytes())
+    except FileNotFoundError as exc:
+        raise FileNotFoundError(f"余白ルールファイルが見つかりません: {rules_path}") from exc
     except (OSError, json.JSONDecodeError) as exc:
         raise ValueError(f"余白ルールファイルの読み込みに失敗しました: {rules_path}") from exc
 
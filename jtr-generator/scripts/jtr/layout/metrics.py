@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 from reportlab.pdfbase import pdfmetrics
 
 # 共通実装を再エクスポート（tools/からの参照互換性維持）
@@ -8,9 +10,16 @@ from ..helper.fonts import register_font
 __all__ = ["register_font", "get_font_metrics"]
 
 
-def get_font_metrics(font_name: str, font_size: float) -> dict[str, float]:
+@lru_cache(maxsize=256)
+def _font_vertical_metrics(font_name: str, font_size: float) -> tuple[float, float]:
     ascent = float(pdfmetrics.getAscent(font_name, font_size))
     descent = float(pdfmetrics.getDescent(font_name, font_size))
+    return ascent, descent
+
+
+def get_font_metrics(font_name: str, font_size: float) -> dict[str, float]:
+    # キャッシュは不変タプルで保持し、呼び出し側には毎回新しい辞書を返す
+    ascent, descent = _font_vertical_metrics(font_name, font_size)
     height = ascent - descent
     return {
         "ascent": ascent,
@@ -5,7 +5,11 @@ Mistune (GFMプラグイン) のASTをReportLab Flowablesに変換する。
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+import io
+import weakref
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Protocol, cast
 
 import mistune
@@ -15,10 +19,28 @@ from reportlab.lib.units import mm
 from reportlab.platypus import HRFlowable, Paragraph, Preformatted, Table, TableStyle
 from reportlab.platypus import paragraph as paragraph_module
 
-__all__ = ["HeadingBar", "markdown_to_flowables"]
+__all__ = ["HeadingBar", "clear_markdown_cache", "markdown_to_flowables"]
 
 _GFM_PLUGINS = ["strikethrough", "table", "task_lists", "url"]
 _MARKDOWN = mistune.create_markdown(renderer="ast", plugins=_GFM_PLUGINS)
+_AST_CACHE_SIZE = 256
+_STYLE_CACHE_SIZE = 64
+_DERIVED_STYLES: weakref.WeakKeyDictionary[
+    ParagraphStyle, dict[tuple[Any, ...], ParagraphStyle]
+] = weakref.WeakKeyDictionary()
+_ESCAPE_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", "\n": ""})
+
+
+@lru_cache(maxsize=_AST_CACHE_SIZE)
+def _parse_markdown(markdown: str) -> tuple[dict[str, Any], ...]:
+    # 同じ本文を複数回描画する場合にMistuneの解析を省略する。
+    # 返すトークンは共有されるため、呼び出し側では読み取り専用として扱うこと。
+    return tuple(cast(list[dict[str, Any]], _MARKDOWN(markdown)))
+
+
+def clear_markdown_cache() -> None:
+    """Markdown解析結果のキャッシュを破棄する"""
+    _parse_markdown.cache_clear()
 
 
 if TYPE_CHECKING:
@@ -70,7 +92,7 @@ class HeadingBar(FlowableBase):
 
     def wrap(self, avail_width: float, avail_height: float) -> tuple[float, float]:
         inner_width = max(avail_width - 2 * self.padding_x, 0)
-        self._paragraph = Paragraph(self.text, self.style)
+        # __init__で解析済みのParagraphを再利用し、幅に応じた折り返しだけをやり直す
         _, height = self._paragraph.wrap(inner_width, avail_height)
         self._paragraph_height = height
         self.width = avail_width
@@ -175,29 +197,139 @@ def markdown_to_flowables(
     if not markdown.strip():
         return flowables
 
-    decorations = decorations or {}
-    tokens = cast(list[dict[str, Any]], _MARKDOWN(markdown))
+    decor = _preprocess_decorations(decorations or {})
+    tokens = _parse_markdown(markdown)
     section_depth = 0
-    section_indent_step = float(decorations.get("section_indent_step", 0))
     for token in tokens:
         section_depth = _append_block(
             token,
             flowables,
             styles,
-            decorations,
+            decor,
             list_depth=0,
             section_depth=section_depth,
-            section_indent_step=section_indent_step,
+            section_indent_step=decor.section_indent_step,
         )
 
     return flowables
 
 
+@dataclass(frozen=True, slots=True)
+class _RuleDecoration:
+    color: colors.Color
+    thickness: float
+    space_before: float
+    space_after: float
+
+
+@dataclass(frozen=True, slots=True)
+class _HeadingBarDecoration:
+    background: colors.Color
+    padding_x: float
+    padding_y: float
+    space_before: float
+    space_after: float
+
+
+@dataclass(frozen=True, slots=True)
+class _BlockQuoteDecoration:
+    indent: float
+    # Noneの場合は本文スタイルの文字色を使う
+    text_color: colors.Color | None
+
+
+@dataclass(frozen=True, slots=True)
+class _CodeBlockDecoration:
+    font_name: str
+    # Noneの項目は本文スタイルの値を使う
+    font_size: float | None
+    leading: float | None
+    background: colors.Color
+    left_indent: float | None
+    space_before: float
+    space_after: float
+
+
+@dataclass(frozen=True, slots=True)
+class _TableDecoration:
+    line_color: colors.Color
+    header_background: colors.Color
+    line_width: float
+    cell_padding: float
+
+
+@dataclass(frozen=True, slots=True)
+class _Decorations:
+    section_indent_step: float
+    heading2_bar: _HeadingBarDecoration | None
+    heading2_rule: _RuleDecoration
+    thematic_break: _RuleDecoration
+    blockquote: _BlockQuoteDecoration
+    code_block: _CodeBlockDecoration
+    table: _TableDecoration
+
+
+def _preprocess_decorations(decorations: dict[str, Any]) -> _Decorations:
+    # 色の解決や数値変換をブロックごとに繰り返さないよう、変換開始時に一度だけ行う
+    bar = decorations.get("heading2_bar")
+    quote = decorations.get("blockquote", {})
+    code = decorations.get("code_block", {})
+    table = decorations.get("table", {})
+    return _Decorations(
+        section_indent_step=float(decorations.get("section_indent_step", 0)),
+        heading2_bar=_preprocess_heading_bar(bar) if bar else None,
+        heading2_rule=_preprocess_rule(decorations.get("heading2_rule", {})),
+        thematic_break=_preprocess_rule(decorations.get("thematic_break", {})),
+        blockquote=_BlockQuoteDecoration(
+            indent=float(quote.get("indent", 6 * mm)),
+            text_color=_resolve_optional_color(quote.get("text_color")),
+        ),
+        code_block=_CodeBlockDecoration(
+            font_name=str(code.get("font_name", "Courier")),
+            font_size=_optional_float(code.get("font_size")),
+            leading=_optional_float(code.get("leading")),
+            background=_resolve_color(code.get("background"), colors.white),
+            left_indent=_optional_float(code.get("left_indent")),
+            space_before=float(code.get("space_before", 0)),
+            space_after=float(code.get("space_after", 0)),
+        ),
+        table=_TableDecoration(
+            line_color=_resolve_color(table.get("line_color"), colors.black),
+            header_background=_resolve_color(table.get("header_background"), colors.white),
+            line_width=float(table.get("line_width", 0.5)),
+            cell_padding=float(table.get("cell_padding", 4)),
+        ),
+    )
+
+
+def _preprocess_rule(rule: dict[str, Any]) -> _RuleDecoration:
+    return _RuleDecoration(
+        color=_resolve_color(rule.get("color"), colors.black),
+        thickness=float(rule.get("thickness", 0.5)),
+        space_before=float(rule.get("space_before", 0)),
+        space_after=float(rule.get("space_after", 0)),
+    )
+
+
+def _preprocess_heading_bar(bar: dict[str, Any]) -> _HeadingBarDecoration:
+    return _HeadingBarDecoration(
+        background=_resolve_color(bar.get("background"), colors.black),
+        padding_x=float(bar.get("padding_x", 0)),
+        padding_y=float(bar.get("padding_y", 0)),
+        space_before=float(bar.get("space_before", 0)),
+        space_after=float(bar.get("space_after", 0)),
+    )
+
+
+def _optional_float(value: Any) -> float | None:
+    return None if value is None else float(value)
+
+
 def _append_block(
     token: dict[str, Any],
     flowables: list[Any],
     styles: dict[str, ParagraphStyle],
-    decorations: dict[str, Any],
+    decor: _Decorations,
     list_depth: int,
     section_depth: int,
     section_indent_step: float,
@@ -206,27 +338,30 @@ def _append_block(
     if node_kind in ("blank_line", None):
         return section_depth
 
+    # 本文ブロックのインセットはブロックごとに一度だけ求めて各処理へ渡す
+    inset = section_depth * section_indent_step
+
     if node_kind == "heading":
         level = int(token.get("attrs", {}).get("level", 2))
         text = _render_inline(token.get("children", []))
         if level <= 2:
-            _append_h2_heading(text, flowables, styles, decorations)
+            _append_h2_heading(text, flowables, styles, decor)
             return 1
         heading_depth = max(level - 2, 0)
         heading_indent = heading_depth * section_indent_step
         if level == 3:
             heading = _build_paragraph(text, styles["Heading3"])
-            _append_flowable(flowables, _wrap_inset(heading, heading_indent))
+            _append_inset(flowables, heading, heading_indent)
             return 2
         heading_style = _resolve_heading_style(styles, level)
         heading = _build_paragraph(text, heading_style)
-        _append_flowable(flowables, _wrap_inset(heading, heading_indent))
+        _append_inset(flowables, heading, heading_indent)
         return min(level - 1, 6)
 
     if node_kind == "paragraph":
         text = _render_inline(token.get("children", []))
         body = _build_paragraph(text, styles["BodyText"])
-        _append_flowable(flowables, _wrap_inset(body, section_depth * section_indent_step))
+        _append_inset(flowables, body, inset)
         return section_depth
 
     if node_kind == "list":
@@ -234,10 +369,9 @@ def _append_block(
             token,
             flowables,
             styles,
-            decorations,
+            decor,
             list_depth,
-            section_depth,
-            section_indent_step,
+            inset,
         )
         return section_depth
 
@@ -246,9 +380,8 @@ def _append_block(
             token,
             flowables,
             styles,
-            decorations,
-            section_depth,
-            section_indent_step,
+            decor,
+            inset,
         )
         return section_depth
 
@@ -257,18 +390,16 @@ def _append_block(
             token,
             flowables,
             styles,
-            decorations,
-            section_depth,
-            section_indent_step,
+            decor,
+            inset,
         )
         return section_depth
 
     if node_kind == "thematic_break":
         _append_rule(
             flowables,
-            decorations.get("thematic_break", {}),
-            section_depth,
-            section_indent_step,
+            decor.thematic_break,
+            inset,
         )
         return section_depth
 
@@ -277,9 +408,8 @@ def _append_block(
             token,
             flowables,
             styles,
-            decorations,
-            section_depth,
-            section_indent_step,
+            decor,
+            inset,
         )
         return section_depth
     return section_depth
@@ -289,51 +419,45 @@ def _append_h2_heading(
     text: str,
     flowables: list[Any],
     styles: dict[str, ParagraphStyle],
-    decorations: dict[str, Any],
+    decor: _Decorations,
 ) -> None:
-    bar = decorations.get("heading2_bar")
-    if bar:
-        _append_flowable(flowables, _create_heading_bar(text, styles, bar))
+    if decor.heading2_bar is not None:
+        flowables.append(_create_heading_bar(text, styles, decor.heading2_bar))
         return
     para = _build_paragraph(text, styles["Heading2"])
     para.keepWithNext = 1
-    _append_flowable(flowables, para)
-    _append_rule(flowables, decorations.get("heading2_rule", {}), 0, 0)
+    flowables.append(para)
+    _append_rule(flowables, decor.heading2_rule, 0)
 
 
 def _append_rule(
     flowables: list[Any],
-    rule: dict[str, Any],
-    section_depth: int,
-    section_indent_step: float,
+    rule: _RuleDecoration,
+    inset: float,
 ) -> None:
-    color = _resolve_color(rule.get("color"), colors.black)
     line = HRFlowable(
         width="100%",
-        thickness=float(rule.get("thickness", 0.5)),
-        color=color,
-        spaceBefore=float(rule.get("space_before", 0)),
-        spaceAfter=float(rule.get("space_after", 0)),
+        thickness=rule.thickness,
+        color=rule.color,
+        spaceBefore=rule.space_before,
+        spaceAfter=rule.space_after,
     )
-    _append_flowable(flowables, _wrap_inset(line, section_depth * section_indent_step))
+    _append_inset(flowables, line, inset)
 
 
 def _create_heading_bar(
     text: str,
     styles: dict[str, ParagraphStyle],
-    bar: dict[str, Any],
+    bar: _HeadingBarDecoration,
 ) -> HeadingBar:
-    background = _resolve_color(bar.get("background"), colors.black)
-    padding_x = float(bar.get("padding_x", 0))
-    padding_y = float(bar.get("padding_y", 0))
     return HeadingBar(
         text=text,
         style=styles["Heading2"],
-        background=background,
-        padding_x=padding_x,
-        padding_y=padding_y,
-        space_before=float(bar.get("space_before", 0)),
-        space_after=float(bar.get("space_after", 0)),
+        background=bar.background,
+        padding_x=bar.padding_x,
+        padding_y=bar.padding_y,
+        space_before=bar.space_before,
+        space_after=bar.space_after,
     )
 
 
@@ -341,40 +465,38 @@ def _append_list(
     token: dict[str, Any],
     flowables: list[Any],
     styles: dict[str, ParagraphStyle],
-    decorations: dict[str, Any],
+    decor: _Decorations,
     list_depth: int,
-    section_depth: int,
-    section_indent_step: float,
+    inset: float,
 ) -> None:
     attrs = token.get("attrs", {})
     ordered = bool(attrs.get("ordered"))
     items = token.get("children", [])
     index = 1
+    bullet_style = _bullet_style(styles["Bullet"], list_depth)
+    # 項目数に比例して呼ばれるため、追加処理はバインド済みメソッドで直接行う
+    append = flowables.append
 
     for item in items:
         item_type = item.get("type")
         if item_type not in ("list_item", "task_list_item"):
             continue
         bullet_text = _render_list_item(item)
-        bullet_style = _bullet_style(styles["Bullet"], list_depth)
         if item_type == "task_list_item":
             checked = bool(item.get("attrs", {}).get("checked"))
             prefix = "[x]" if checked else "[ ]"
             bullet_text = f"{prefix} {bullet_text}".strip()
-            bullet = _build_paragraph(f"• {bullet_text}", bullet_style)
-            _append_flowable(flowables, _wrap_inset(bullet, section_depth * section_indent_step))
+            marker = "•"
+        elif ordered:
+            marker = f"{index}."
+            index += 1
         else:
-            if ordered:
-                bullet = _build_paragraph(f"{index}. {bullet_text}", bullet_style)
-                _append_flowable(
-                    flowables, _wrap_inset(bullet, section_depth * section_indent_step)
-                )
-                index += 1
-            else:
-                bullet = _build_paragraph(f"• {bullet_text}", bullet_style)
-                _append_flowable(
-                    flowables, _wrap_inset(bullet, section_depth * section_indent_step)
-                )
+            marker = "•"
+        bullet = _build_paragraph(f"{marker} {bullet_text}", bullet_style)
+        if inset > 0:
+            append(InsetFlowable(bullet, inset, inset))
+        else:
+            append(bullet)
 
         for child in item.get("children", []):
             if child.get("type") == "list":
@@ -382,10 +504,9 @@ def _append_list(
                     child,
                     flowables,
                     styles,
-                    decorations,
+                    decor,
                     list_depth + 1,
-                    section_depth,
-                    section_indent_step,
+                    inset,
                 )
 
 
@@ -393,66 +514,62 @@ def _append_block_quote(
     token: dict[str, Any],
     flowables: list[Any],
     styles: dict[str, ParagraphStyle],
-    decorations: dict[str, Any],
-    section_depth: int,
-    section_indent_step: float,
+    decor: _Decorations,
+    inset: float,
 ) -> None:
-    quote = decorations.get("blockquote", {})
-    indent = float(quote.get("indent", 6 * mm))
-    text_color = _resolve_color(quote.get("text_color"), styles["BodyText"].textColor)
-    quote_style = ParagraphStyle(
-        "BlockQuote",
-        parent=styles["BodyText"],
-        leftIndent=styles["BodyText"].leftIndent + indent,
-        textColor=text_color,
+    indent = decor.blockquote.indent
+    body = styles["BodyText"]
+    text_color = decor.blockquote.text_color
+    if text_color is None:
+        text_color = body.textColor
+    quote_style = _derived_style(
+        body,
+        ("BlockQuote", body.leftIndent, indent, text_color),
+        lambda: ParagraphStyle(
+            "BlockQuote",
+            parent=body,
+            leftIndent=body.leftIndent + indent,
+            textColor=text_color,
+        ),
     )
     for child in token.get("children", []):
         if child.get("type") == "paragraph":
             text = _render_inline(child.get("children", []))
             quote = _build_paragraph(text, quote_style)
-            _append_flowable(flowables, _wrap_inset(quote, section_depth * section_indent_step))
+            _append_inset(flowables, quote, inset)
 
 
 def _append_block_code(
     token: dict[str, Any],
     flowables: list[Any],
     styles: dict[str, ParagraphStyle],
-    decorations: dict[str, Any],
-    section_depth: int,
-    section_indent_step: float,
+    decor: _Decorations,
+    inset: float,
 ) -> None:
-    code = decorations.get("code_block", {})
-    font_name = str(code.get("font_name", "Courier"))
-    font_size = float(code.get("font_size", styles["BodyText"].fontSize))
-    leading = float(code.get("leading", styles["BodyText"].leading))
-    back_color = _resolve_color(code.get("background"), colors.white)
-    left_indent = float(code.get("left_indent", styles["BodyText"].leftIndent))
-    space_before = float(code.get("space_before", 0))
-    space_after = float(code.get("space_after", 0))
-    code_style = ParagraphStyle(
-        "CodeBlock",
-        fontName=font_name,
-        fontSize=font_size,
-        leading=leading,
-        backColor=back_color,
-        leftIndent=left_indent,
-        spaceBefore=space_before,
-        spaceAfter=space_after,
+    code = decor.code_block
+    body = styles["BodyText"]
+    code_style = _code_block_style(
+        code.font_name,
+        float(body.fontSize if code.font_size is None else code.font_size),
+        float(body.leading if code.leading is None else code.leading),
+        code.background,
+        float(body.leftIndent if code.left_indent is None else code.left_indent),
+        code.space_before,
+        code.space_after,
     )
     raw = token.get("raw", "")
     code_block = Preformatted(raw.rstrip("\n"), code_style)
     code_block.spaceBefore = code_style.spaceBefore
     code_block.spaceAfter = code_style.spaceAfter
-    _append_flowable(flowables, _wrap_inset(code_block, section_depth * section_indent_step))
+    _append_inset(flowables, code_block, inset)
 
 
 def _append_table(
     token: dict[str, Any],
     flowables: list[Any],
     styles: dict[str, ParagraphStyle],
-    decorations: dict[str, Any],
-    section_depth: int,
-    section_indent_step: float,
+    decor: _Decorations,
+    inset: float,
 ) -> None:
     header_rows: list[list[str]] = []
     body_rows: list[list[str]] = []
@@ -468,40 +585,43 @@ def _append_table(
         return
 
     table = Table(rows, hAlign="LEFT")
-    table_style = _build_table_style(len(header_rows), styles["BodyText"], decorations)
+    table_style = _build_table_style(len(header_rows), styles["BodyText"], decor.table)
     table.setStyle(table_style)
-    _append_flowable(flowables, _wrap_inset(table, section_depth * section_indent_step))
+    _append_inset(flowables, table, inset)
 
 
 def _extract_table_rows(token: dict[str, Any]) -> list[list[str]]:
-    rows: list[list[str]] = []
     children = token.get("children", [])
     if children and children[0].get("type") == "table_cell":
-        rows.append([_render_inline(cell.get("children", [])) for cell in children])
-        return rows
+        return [_render_table_cells(children)]
+    rows: list[list[str]] = []
     for row in children:
         if row.get("type") != "table_row":
             continue
-        cells = [
-            _render_inline(cell.get("children", []))
-            for cell in row.get("children", [])
-            if cell.get("type") == "table_cell"
-        ]
+        cells = _render_table_cells(row.get("children", []))
         if cells:
             rows.append(cells)
     return rows
 
 
+def _render_table_cells(cells: Iterable[dict[str, Any]]) -> list[str]:
+    # 空セルはインライン描画を経由せず空文字にする
+    return [
+        _render_inline(children) if (children := cell.get("children")) else ""
+        for cell in cells
+        if cell.get("type") == "table_cell"
+    ]
+
+
 def _build_table_style(
     header_rows: int,
     base_style: ParagraphStyle,
-    decorations: dict[str, Any],
+    table: _TableDecoration,
 ) -> TableStyle:
-    table = decorations.get("table", {})
-    line_color = _resolve_color(table.get("line_color"), colors.black)
-    header_background = _resolve_color(table.get("header_background"), colors.white)
-    line_width = float(table.get("line_width", 0.5))
-    cell_padding = float(table.get("cell_padding", 4))
+    line_color = table.line_color
+    header_background = table.header_background
+    line_width = table.line_width
+    cell_padding = table.cell_padding
     style_commands: list[tuple[Any, ...]] = [
         ("LINEBELOW", (0, 0), (-1, -1), line_width, line_color),
         ("LEFTPADDING", (0, 0), (-1, -1), cell_padding),
@@ -529,62 +649,174 @@ def _render_list_item(item: dict[str, Any]) -> str:
     for child in item.get("children", []):
         child_type = child.get("type")
         if child_type == "block_text" or child_type == "paragraph":
-            parts.append(_render_inline(child.get("children", [])))
-    return " ".join([part for part in parts if part]).strip()
+            inline = child.get("children")
+            if inline and (text := _render_inline(inline)):
+                parts.append(text)
+    # 項目の本文はほぼ1要素のため、結合は複数ある場合だけ行う
+    if not parts:
+        return ""
+    if len(parts) == 1:
+        return parts[0].strip()
+    return " ".join(parts).strip()
+
+
+_InlineHandler = Callable[[dict[str, Any], io.StringIO], None]
+_CODESPAN_OPEN = '<font face="Courier">'
+_CODESPAN_CLOSE = "</font>"
+_LINK_OPEN = '<a href="'
+_LINK_OPEN_END = '">'
+_LINK_CLOSE = "</a>"
 
 
 def _render_inline(tokens: Iterable[dict[str, Any]]) -> str:
-    parts: list[str] = []
+    # 装飾の無いテキスト1つだけの子要素（段落・セルで最も多い形）はバッファを使わず返す
+    if isinstance(tokens, list) and len(tokens) == 1 and tokens[0].get("type") == "text":
+        return _escape_text(tokens[0].get("raw", ""))
+    buf = io.StringIO()
+    _render_inline_into(tokens, buf)
+    return buf.getvalue()
+
+
+def _render_inline_into(tokens: Iterable[dict[str, Any]], buf: io.StringIO) -> None:
+    # 入れ子の装飾ごとに文字列を組み立てず、1つのバッファへ順に書き込む
+    handlers = _INLINE_HANDLERS
     for token in tokens:
-        node_kind = token.get("type")
-        if node_kind == "text":
-            parts.append(_escape_text(token.get("raw", "")))
-        elif node_kind == "strong":
-            parts.append(f"<b>{_render_inline(token.get('children', []))}</b>")
-        elif node_kind == "emphasis":
-            parts.append(f"<i>{_render_inline(token.get('children', []))}</i>")
-        elif node_kind == "strikethrough":
-            parts.append(f"<strike>{_render_inline(token.get('children', []))}</strike>")
-        elif node_kind == "codespan":
-            code = _escape_text(token.get("raw", ""))
-            parts.append(f'<font face="Courier">{code}</font>')
-        elif node_kind == "link":
-            url = _escape_text(token.get("attrs", {}).get("url", ""))
-            label = _render_inline(token.get("children", []))
-            parts.append(f'<a href="{url}">{label}</a>')
-        elif node_kind == "image":
-            alt = _escape_text(token.get("attrs", {}).get("alt", ""))
-            if alt:
-                parts.append(alt)
-        elif node_kind == "linebreak":
-            parts.append("<br/>")
-        elif node_kind == "softbreak":
-            parts.append(" ")
-    return "".join(parts)
+        handler = handlers.get(token.get("type"))
+        if handler is not None:
+            handler(token, buf)
+
+
+def _tag_handler(open_tag: str, close_tag: str) -> _InlineHandler:
+    def handle(token: dict[str, Any], buf: io.StringIO) -> None:
+        buf.write(open_tag)
+        _render_inline_into(token.get("children", []), buf)
+        buf.write(close_tag)
+
+    return handle
+
+
+def _literal_handler(literal: str) -> _InlineHandler:
+    def handle(token: dict[str, Any], buf: io.StringIO) -> None:
+        buf.write(literal)
+
+    return handle
+
+
+def _render_text(token: dict[str, Any], buf: io.StringIO) -> None:
+    buf.write(_escape_text(token.get("raw", "")))
+
+
+def _render_codespan(token: dict[str, Any], buf: io.StringIO) -> None:
+    buf.write(_CODESPAN_OPEN)
+    buf.write(_escape_text(token.get("raw", "")))
+    buf.write(_CODESPAN_CLOSE)
+
+
+def _render_link(token: dict[str, Any], buf: io.StringIO) -> None:
+    buf.write(_LINK_OPEN)
+    buf.write(_escape_text(token.get("attrs", {}).get("url", "")))
+    buf.write(_LINK_OPEN_END)
+    _render_inline_into(token.get("children", []), buf)
+    buf.write(_LINK_CLOSE)
+
+
+def _render_image(token: dict[str, Any], buf: io.StringIO) -> None:
+    alt = _escape_text(token.get("attrs", {}).get("alt", ""))
+    if alt:
+        buf.write(alt)
+
+
+_INLINE_HANDLERS: dict[Any, _InlineHandler] = {
+    "text": _render_text,
+    "strong": _tag_handler("<b>", "</b>"),
+    "emphasis": _tag_handler("<i>", "</i>"),
+    "strikethrough": _tag_handler("<strike>", "</strike>"),
+    "codespan": _render_codespan,
+    "link": _render_link,
+    "image": _render_image,
+    "linebreak": _literal_handler("<br/>"),
+    "softbreak": _literal_handler(" "),
+}
 
 
 def _escape_text(text: str) -> str:
-    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace("\n", "")
+    return text.translate(_ESCAPE_TABLE)
 
 
 def _resolve_color(value: Any, fallback: colors.Color) -> colors.Color:
     if isinstance(value, colors.Color):
         return value
     if isinstance(value, str) and value:
-        return colors.HexColor(value)
+        return _hex_color(value)
     return fallback
 
 
+@lru_cache(maxsize=_STYLE_CACHE_SIZE)
+def _hex_color(value: str) -> colors.Color:
+    # 同じ色指定の文字列は一度だけ解析する（返したColorは共有されるため変更しない）
+    return colors.HexColor(value)
+
+
+def _derived_style(
+    base: ParagraphStyle,
+    key: tuple[Any, ...],
+    factory: Callable[[], ParagraphStyle],
+) -> ParagraphStyle:
+    # 親スタイルごとに派生スタイルを使い回す（親が破棄されればキャッシュも消える）。
+    # keyには派生時に参照する親の属性値を含め、親の変更後に古いスタイルを返さないようにする。
+    derived = _DERIVED_STYLES.get(base)
+    if derived is None:
+        derived = {}
+        _DERIVED_STYLES[base] = derived
+    style = derived.get(key)
+    if style is None:
+        style = factory()
+        derived[key] = style
+    return style
+
+
+def _resolve_optional_color(value: Any) -> colors.Color | None:
+    if isinstance(value, colors.Color) or (isinstance(value, str) and value):
+        return _resolve_color(value, colors.black)
+    return None
+
+
 def _bullet_style(base: ParagraphStyle, depth: int) -> ParagraphStyle:
     if depth <= 0:
         return base
     indent = base.leftIndent + depth * (4 * mm)
     hanging = base.firstLineIndent
+    return _derived_style(
+        base,
+        ("Depth", depth, base.name, indent, hanging),
+        lambda: ParagraphStyle(
+            f"{base.name}Depth{depth}",
+            parent=base,
+            leftIndent=indent,
+            firstLineIndent=hanging,
+        ),
+    )
+
+
+@lru_cache(maxsize=_STYLE_CACHE_SIZE)
+def _code_block_style(
+    font_name: str,
+    font_size: float,
+    leading: float,
+    back_color: colors.Color,
+    left_indent: float,
+    space_before: float,
+    space_after: float,
+) -> ParagraphStyle:
     return ParagraphStyle(
-        f"{base.name}Depth{depth}",
-        parent=base,
-        leftIndent=indent,
-        firstLineIndent=hanging,
+        "CodeBlock",
+        fontName=font_name,
+        fontSize=font_size,
+        leading=leading,
+        backColor=back_color,
+        leftIndent=left_indent,
+        spaceBefore=space_before,
+        spaceAfter=space_after,
     )
 
 
@@ -598,14 +830,12 @@ def _resolve_heading_style(
     return styles.get(style_name, styles["Heading4"])
 
 
-def _wrap_inset(flowable: FlowableBase, indent: float) -> FlowableBase:
-    if indent <= 0:
-        return flowable
-    return InsetFlowable(flowable, indent, indent)
-
-
-def _append_flowable(flowables: list[Any], flowable: FlowableBase) -> None:
-    flowables.append(flowable)
+def _append_inset(flowables: list[Any], flowable: FlowableBase, inset: float) -> None:
+    # インセット無し（既定）の場合はラッパーを作らずそのまま追加する
+    if inset <= 0:
+        flowables.append(flowable)
+    else:
+        flowables.append(InsetFlowable(flowable, inset, inset))
 
 
 def _build_paragraph(text: str, style: ParagraphStyle) -> Paragraph:
@@ -1,49 +1,169 @@
 """履歴書データの読み込み・検証"""
 
 import json
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, cast
 
 import jsonschema
 import yaml
+from jsonschema.protocols import Validator
 
 from .helper.paths import get_schema_path
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - libyaml無しでビルドされたPyYAML
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
 
-def _normalize_dates(data: Any) -> Any:
+
+class _StrDateLoader(_YamlLoader):
+    """日付・日時をdate/datetimeに変換せず、ISO形式の文字列として読み込むローダー"""
+
+
+def _construct_timestamp_str(loader: _YamlLoader, node: yaml.ScalarNode) -> str:
+    # JSON Schemaは日付を文字列として期待するため、パース時点で文字列に戻す
+    value: date | datetime = loader.construct_yaml_timestamp(node)
+    return value.isoformat()
+
+
+_StrDateLoader.add_constructor("tag:yaml.org,2002:timestamp", _construct_timestamp_str)
+
+
+def _load_yaml(stream: Any) -> Any:
     """
-    YAML読み込み時に自動変換されたdatetime.dateオブジェクトを文字列に変換
+    YAMLを読み込む（safe_loadと同じタグのみ解釈し、日付はISO形式の文字列のまま返す）
+
+    libyamlが使える場合はCローダーを使う。
+    """
+    return yaml.load(stream, Loader=_StrDateLoader)  # noqa: S506 - SafeLoader派生
+
+
+def _parse_data_string(text: str) -> Any:
+    """
+    YAML/JSON文字列をパースする
+
+    先頭が「{」または「[」の場合はJSONとして先に解釈し、YAMLパーサーを経由しない。
+    JSONとして解釈できなければYAML（フロー形式）として読み直す。
+    YAMLでも失敗した場合は従来どおりJSONとして再試行する。
 
     Args:
-        data: 任意のデータ構造
+        text: YAMLまたはJSON形式の文字列
 
     Returns:
-        日付オブジェクトが文字列に変換されたデータ
+        パース結果（YAMLの日付は文字列として読み込まれる）
+
+    Raises:
+        json.JSONDecodeError: YAML/JSONいずれとしても解釈できない場合
     """
-    if isinstance(data, dict):
-        return {key: _normalize_dates(value) for key, value in data.items()}
-    if isinstance(data, list):
-        return [_normalize_dates(item) for item in data]
-    if isinstance(data, (datetime, date)):
-        return data.isoformat()
-    return data
+    if text.lstrip()[:1] in ("{", "["):
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError:
+            pass
+    try:
+        return _load_yaml(text)
+    except yaml.YAMLError:
+        return json.loads(text)
 
 
-def load_rirekisho_data(file_path: Path) -> dict[str, Any]:
+def _is_data_string(value: str) -> bool:
     """
-    YAML/JSONファイルから履歴書データを読み込み、スキーマ検証を行う
+    文字列がYAML/JSONデータか（ファイルパスではないか）を判定する
+
+    ファイルパスに通常現れない記法（改行、先頭の「{」、YAMLマッピングの「: 」）を含む場合は
+    ファイルシステムを確認せずデータとみなす。それ以外は存在しないパスをデータとして扱う。
+
+    Args:
+        value: 判定対象の文字列
+
+    Returns:
+        YAML/JSONデータとして扱う場合はTrue
+    """
+    if "\n" in value or ": " in value or value.lstrip().startswith("{"):
+        return True
+    try:
+        return not Path(value).exists()
+    except OSError:
+        # パスとして不正な場合（長すぎる等）は文字列データとして扱う
+        return True
+
+
+@lru_cache(maxsize=8)
+def _load_schema(schema_name: str) -> dict[str, Any]:
+    """
+    スキーマファイルを読み込み、プロセス内でキャッシュする
+
+    Args:
+        schema_name: スキーマファイル名（例: "rirekisho_schema.json"）
+
+    Returns:
+        パース済みのJSON Schema（共有されるため変更しないこと）
+
+    Raises:
+        FileNotFoundError: スキーマファイルが存在しない場合
+    """
+    schema_path = get_schema_path(schema_name)
+    if not schema_path.exists():
+        raise FileNotFoundError(f"Schema file not found: {schema_path}")
+    return cast(dict[str, Any], json.loads(schema_path.read_bytes()))
+
+
+@lru_cache(maxsize=8)
+def _validator_for(schema_name: str) -> Validator:
+    """
+    スキーマ名に対応するバリデータを生成し、プロセス内でキャッシュする
+
+    Args:
+        schema_name: スキーマファイル名（例: "rirekisho_schema.json"）
+
+    Returns:
+        スキーマの$schemaに対応するjsonschemaバリデータ
+
+    Raises:
+        FileNotFoundError: スキーマファイルが存在しない場合
+        jsonschema.SchemaError: スキーマ自体が不正な場合
+    """
+    schema = _load_schema(schema_name)
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
+
+
+def _validate(data: Any, schema_name: str) -> None:
+    """
+    キャッシュ済みバリデータでデータを検証する
+
+    jsonschema.validateと同様に、最も関連度の高いエラーを送出する。
+
+    Args:
+        data: 検証対象のデータ
+        schema_name: スキーマファイル名
+
+    Raises:
+        jsonschema.ValidationError: スキーマバリデーション失敗時
+    """
+    error = jsonschema.exceptions.best_match(_validator_for(schema_name).iter_errors(data))
+    if error is not None:
+        raise error
+
+
+def _load_data_file(file_path: Path) -> Any:
+    """
+    YAML/JSONファイルを読み込む（スキーマ検証は行わない）
 
     Args:
         file_path: YAMLまたはJSONファイルのパス
 
     Returns:
-        履歴書データ（schemas/rirekisho_schema.json準拠）
+        パース結果
 
     Raises:
         FileNotFoundError: ファイルが存在しない場合
         ValueError: ファイル形式が非対応、またはYAML/JSONパースエラー
-        jsonschema.ValidationError: スキーマバリデーション失敗時
     """
     # ファイル存在チェック
     if not file_path.exists():
@@ -56,31 +176,89 @@ def load_rirekisho_data(file_path: Path) -> dict[str, Any]:
             f"Unsupported file format: {suffix}. Only .yaml, .yml, or .json files are supported."
         )
 
-    # ファイル読み込み
+    # ファイル読み込み（一括で読み、連続したバッファをパーサに渡す）
     try:
-        with open(file_path, encoding="utf-8") as f:
-            if suffix == ".json":
-                data = json.load(f)
-            else:  # .yaml or .yml
-                data = yaml.safe_load(f)
-                # YAMLの日付自動変換を元に戻す（JSON Schemaは文字列を期待）
-                data = _normalize_dates(data)
+        raw = file_path.read_bytes()
+        return json.loads(raw) if suffix == ".json" else _load_yaml(raw)
     except yaml.YAMLError as e:
         raise ValueError(f"Failed to parse YAML file: {e}") from e
     except json.JSONDecodeError as e:
         raise ValueError(f"Failed to parse JSON file: {e}") from e
 
-    # スキーマバリデーション
-    schema_path = get_schema_path("rirekisho_schema.json")
-    with open(schema_path, encoding="utf-8") as f:
-        schema = json.load(f)
 
-    jsonschema.validate(instance=data, schema=schema)
+def load_rirekisho_data(file_path: Path) -> dict[str, Any]:
+    """
+    YAML/JSONファイルから履歴書データを読み込み、スキーマ検証を行う
+
+    Args:
+        file_path: YAMLまたはJSONファイルのパス
+
+    Returns:
+        履歴書データ（schemas/rirekisho_schema.json準拠）
+
+    Raises:
+        FileNotFoundError: ファイルが存在しない場合
+        ValueError: ファイル形式が非対応、またはYAML/JSONパースエラー
+        jsonschema.ValidationError: スキーマバリデーション失敗時
+    """
+    data = _load_data_file(file_path)
+
+    # スキーマバリデーション
+    _validate(data, "rirekisho_schema.json")
 
     # バリデーション成功後、dataはdict[str, Any]型として扱える
     return cast(dict[str, Any], data)
 
 
+def load_rirekisho_batch(
+    file_paths: Sequence[Path],
+    max_workers: int | None = None,
+) -> list[dict[str, Any]]:
+    """
+    複数の履歴書データファイルを並列に読み込み、スキーマ検証を行う
+
+    YAMLパースとスキーマ検証はCPU処理のため、ファイルごとにプロセスを分けて実行する。
+    各ワーカープロセスがスキーマとバリデータを個別にキャッシュするため、
+    メモリ使用量はワーカー数に比例して増える。
+
+    Args:
+        file_paths: YAMLまたはJSONファイルのパスのリスト
+        max_workers: ワーカープロセス数（Noneの場合はCPU数、1以下の場合は逐次処理）
+
+    Returns:
+        履歴書データのリスト（file_pathsと同じ順序）
+
+    Raises:
+        FileNotFoundError: ファイルが存在しない場合
+        ValueError: ファイル形式が非対応、またはYAML/JSONパースエラー
+        jsonschema.ValidationError: スキーマバリデーション失敗時
+    """
+    # プロセス起動のコストに見合わない場合は現在のプロセスで処理する
+    if len(file_paths) <= 1 or (max_workers is not None and max_workers <= 1):
+        return [load_rirekisho_data(path) for path in file_paths]
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_load_rirekisho_in_worker, file_paths))
+
+
+def _load_rirekisho_in_worker(file_path: Path) -> dict[str, Any]:
+    # バリデータ由来のValidationErrorは型チェッカーを保持しておりpickleできないため、
+    # 呼び出し元プロセスへ返せる形に作り直す。parentは引き継がないため、
+    # anyOf/oneOf配下のエラーでも位置が変わらないよう絶対パスを渡す
+    try:
+        return load_rirekisho_data(file_path)
+    except jsonschema.ValidationError as e:
+        raise jsonschema.ValidationError(
+            e.message,
+            validator=e.validator,
+            path=e.absolute_path,
+            schema_path=e.absolute_schema_path,
+            instance=e.instance,
+            schema=e.schema,
+            validator_value=e.validator_value,
+        ) from None
+
+
 def load_validated_data(
     file_path: str | Path,
     schema_name: str,
@@ -101,32 +279,15 @@ def load_validated_data(
         jsonschema.ValidationError: スキーマバリデーション失敗時
     """
     # 文字列の場合はYAML/JSONとしてパース
-    is_string_data = False
-    if isinstance(file_path, str):
-        # 改行を含む場合は確実に文字列データ
-        if "\n" in file_path:
-            is_string_data = True
-        else:
-            # 改行を含まない場合はファイルパスかもしれないので確認
-            try:
-                if not Path(file_path).exists():
-                    is_string_data = True
-            except OSError:
-                # パスとして不正な場合（長すぎる等）は文字列データとして扱う
-                is_string_data = True
+    is_string_data = isinstance(file_path, str) and _is_data_string(file_path)
 
     if is_string_data:
         # YAML/JSON文字列として解釈（型チェッカーのためにstr型として明示）
         input_str = str(file_path)
         try:
-            data = yaml.safe_load(input_str)
-            data = _normalize_dates(data)
-        except yaml.YAMLError:
-            # YAMLでパース失敗したらJSONとして試行
-            try:
-                data = json.loads(input_str)
-            except json.JSONDecodeError as e:
-                raise ValueError(f"Failed to parse data string: {e}") from e
+            data = _parse_data_string(input_str)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Failed to parse data string: {e}") from e
     else:
         # ファイルパスとして処理
         path = Path(file_path)
@@ -139,24 +300,75 @@ def load_validated_data(
                 f"Unsupported file format: {suffix}. Only .yaml, .yml, or .json files are supported."
             )
 
-        with open(path, encoding="utf-8") as f:
-            if suffix == ".json":
-                data = json.load(f)
-            else:  # .yaml or .yml
-                data = yaml.safe_load(f)
-                data = _normalize_dates(data)
+        raw = path.read_bytes()
+        data = json.loads(raw) if suffix == ".json" else _load_yaml(raw)
 
     # スキーマバリデーション
-    schema_path = get_schema_path(schema_name)
-    if not schema_path.exists():
-        raise FileNotFoundError(f"Schema file not found: {schema_path}")
+    _validate(data, schema_name)
 
-    with open(schema_path, encoding="utf-8") as f:
-        schema = json.load(f)
+    return cast(dict[str, Any], data)
 
-    jsonschema.validate(instance=data, schema=schema)
 
-    return cast(dict[str, Any], data)
+def _format_required_error(error: jsonschema.ValidationError, field_path: str) -> str:
+    missing_field = error.message.split("'")[1]
+    return (
+        f"必須フィールド '{missing_field}' が不足しています。\n"
+        f"対象: {field_path}\n"
+        f"assets/examples/sample_rirekisho.yamlを参考にデータを追加してください。"
+    )
+
+
+def _format_pattern_error(error: jsonschema.ValidationError, field_path: str) -> str:
+    expected_pattern = error.schema.get("pattern", "")  # type: ignore[union-attr]
+    examples = error.schema.get("examples", [])  # type: ignore[union-attr]
+    example_str = f"\n例: {examples[0]}" if examples else ""
+    return (
+        f"フィールド '{field_path}' の形式が不正です。\n"
+        f"期待される形式: {expected_pattern}{example_str}"
+    )
+
+
+def _format_enum_error(error: jsonschema.ValidationError, field_path: str) -> str:
+    allowed_values = error.schema.get("enum", [])  # type: ignore[union-attr]
+    return (
+        f"フィールド '{field_path}' の値が不正です。\n"
+        f"許可される値: {', '.join(str(v) for v in allowed_values)}"
+    )
+
+
+def _format_format_error(error: jsonschema.ValidationError, field_path: str) -> str:
+    if error.schema.get("format") != "date":  # type: ignore[union-attr]
+        return _format_default_error(error, field_path)
+    return (
+        f"フィールド '{field_path}' の日付形式が不正です。\n"
+        f"期待される形式: YYYY-MM-DD（例: 1990-04-01）"
+    )
+
+
+def _format_min_items_error(error: jsonschema.ValidationError, field_path: str) -> str:
+    min_items = error.schema.get("minItems", 0)  # type: ignore[union-attr]
+    return (
+        f"フィールド '{field_path}' は最低{min_items}件の要素が必要です。\n"
+        f"現在の要素数: {len(error.instance) if isinstance(error.instance, list) else 0}"
+    )
+
+
+def _format_default_error(error: jsonschema.ValidationError, field_path: str) -> str:
+    return (
+        f"データ検証エラー: {error.message}\n"
+        f"対象フィールド: {field_path}\n"
+        f"詳細: schemas/rirekisho_schema.jsonを参照してください。"
+    )
+
+
+# よくあるエラーパターン（validatorキーワード）ごとの日本語化ハンドラ
+_VALIDATION_ERROR_FORMATTERS: dict[str, Callable[[jsonschema.ValidationError, str], str]] = {
+    "required": _format_required_error,
+    "pattern": _format_pattern_error,
+    "enum": _format_enum_error,
+    "format": _format_format_error,
+    "minItems": _format_min_items_error,
+}
 
 
 def format_validation_error_ja(error: jsonschema.ValidationError) -> str:
@@ -169,46 +381,11 @@ def format_validation_error_ja(error: jsonschema.ValidationError) -> str:
     Returns:
         日本語エラーメッセージ
     """
-    field_path = ".".join(str(p) for p in error.path) if error.path else "（ルート）"
-
-    # よくあるエラーパターンを日本語化
-    if error.validator == "required":  # type: ignore[comparison-overlap]
-        missing_field = error.message.split("'")[1]
-        return (
-            f"必須フィールド '{missing_field}' が不足しています。\n"
-            f"対象: {field_path}\n"
-            f"assets/examples/sample_rirekisho.yamlを参考にデータを追加してください。"
-        )
-    if error.validator == "pattern":  # type: ignore[comparison-overlap]
-        expected_pattern = error.schema.get("pattern", "")  # type: ignore[union-attr]
-        examples = error.schema.get("examples", [])  # type: ignore[union-attr]
-        example_str = f"\n例: {examples[0]}" if examples else ""
-        return (
-            f"フィールド '{field_path}' の形式が不正です。\n"
-            f"期待される形式: {expected_pattern}{example_str}"
-        )
-    if error.validator == "enum":  # type: ignore[comparison-overlap]
-        allowed_values = error.schema.get("enum", [])  # type: ignore[union-attr]
-        return (
-            f"フィールド '{field_path}' の値が不正です。\n"
-            f"許可される値: {', '.join(str(v) for v in allowed_values)}"
-        )
-    if error.validator == "format" and error.schema.get("format") == "date":  # type: ignore[comparison-overlap, union-attr]
-        return (
-            f"フィールド '{field_path}' の日付形式が不正です。\n"
-            f"期待される形式: YYYY-MM-DD（例: 1990-04-01）"
-        )
-    if error.validator == "minItems":  # type: ignore[comparison-overlap]
-        min_items = error.schema.get("minItems", 0)  # type: ignore[union-attr]
-        return (
-            f"フィールド '{field_path}' は最低{min_items}件の要素が必要です。\n"
-            f"現在の要素数: {len(error.instance) if isinstance(error.instance, list) else 0}"
-        )
-    return (
-        f"データ検証エラー: {error.message}\n"
-        f"対象フィールド: {field_path}\n"
-        f"詳細: schemas/rirekisho_schema.jsonを参照してください。"
-    )
+    # anyOf/oneOf配下のエラーでもルートからの位置を示すよう、absolute_pathを使う
+    path = error.absolute_path
+    field_path = ".".join(map(str, path)) if path else "（ルート）"
+    formatter = _VALIDATION_ERROR_FORMATTERS.get(str(error.validator), _format_default_error)
+    return formatter(error, field_path)
 
 
 def validate_and_load_data(input_data: str | Path) -> dict[str, Any]:
@@ -225,52 +402,25 @@ def validate_and_load_data(input_data: str | Path) -> dict[str, Any]:
         FileNotFoundError: ファイルが存在しない場合
         ValueError: データ形式エラー、パースエラー、バリデーションエラー
     """
-    # ファイルパスの場合
-    is_file_path = False
-    if isinstance(input_data, Path):
-        is_file_path = True
-        file_path = input_data
-    elif isinstance(input_data, str):
-        # 改行を含む場合は文字列データとみなす（OSError回避）
-        if "\n" not in input_data:
-            try:
-                file_path_candidate = Path(input_data)
-                if file_path_candidate.exists():
-                    is_file_path = True
-                    file_path = file_path_candidate
-            except OSError:
-                # 長すぎるパス名などでエラーが発生した場合は文字列データとして扱う
-                pass
-
-    if is_file_path:
+    # ファイルパス・文字列のどちらも読み込みだけを行い、検証は下で一度だけ実施する
+    if isinstance(input_data, Path) or not _is_data_string(input_data):
+        file_path = Path(input_data)
         try:
-            return load_rirekisho_data(file_path)
+            data = _load_data_file(file_path)
         except FileNotFoundError as e:
             raise FileNotFoundError(f"ファイルが見つかりません: {file_path}") from e
-        except jsonschema.ValidationError as e:
-            ja_message = format_validation_error_ja(e)
-            raise ValueError(ja_message) from e
         except ValueError as e:
             raise ValueError(f"データの読み込みに失敗しました: {e}") from e
-
-    # 文字列の場合（YAML/JSON）
-    # input_dataはここまでに来た時点でstr型確定（Path型の場合は上のif is_file_pathで処理済み）
-    input_str = str(input_data)  # 型チェッカーのために明示的に変換
-    try:
-        data = yaml.safe_load(input_str)
-    except yaml.YAMLError:
+    else:
+        # 文字列の場合（YAML/JSON）
         try:
-            data = json.loads(input_str)
+            data = _parse_data_string(input_data)
         except json.JSONDecodeError as e:
             raise ValueError(f"YAML/JSONのパースに失敗しました: {e}") from e
 
     # スキーマバリデーション
-    schema_path = get_schema_path("rirekisho_schema.json")
-    with open(schema_path, encoding="utf-8") as f:
-        schema = json.load(f)
-
     try:
-        jsonschema.validate(instance=data, schema=schema)
+        _validate(data, "rirekisho_schema.json")
     except jsonschema.ValidationError as e:
         ja_message = format_validation_error_ja(e)
         raise ValueError(ja_message) from e
@@ -6,7 +6,8 @@ JIS規格準拠の履歴書PDFを生成します。
 """
 
 import json
-from datetime import date, datetime
+from datetime import date
+from io import BytesIO
 from pathlib import Path
 from typing import Any, Literal, cast
 
@@ -15,7 +16,8 @@ from reportlab.pdfgen import canvas
 
 from .helper.fonts import find_default_font, register_font
 from .helper.generation_context import get_generation_context, init_generation_context
-from .helper.japanese_era import convert_to_wareki
+from .helper.japanese_era import convert_to_wareki, parse_date_ymd
+from .helper.output import write_bytes_atomic
 from .helper.paths import get_layout_path
 
 
@@ -47,8 +49,11 @@ def generate_rirekisho_pdf(
             f"レイアウトファイルの読み込み権限がありません: {layout_json_path}"
         ) from e
 
-    # A4サイズのCanvasを作成
-    c = canvas.Canvas(str(output_path), pagesize=A4)
+    _apply_text_defaults(layout_data)
+
+    # A4サイズのCanvasを作成（メモリ上で描画し、完成後に出力先へ書き込む）
+    buffer = BytesIO()
+    c = canvas.Canvas(buffer, pagesize=A4)
 
     # フォント登録（options['font']でmincho/gothicを選択）
     font_path = _resolve_shared_font(options)
@@ -124,6 +129,19 @@ def generate_rirekisho_pdf(
     c.showPage()
 
     c.save()
+    write_bytes_atomic(output_path, buffer.getvalue())
+
+
+def _apply_text_defaults(layout_data: dict[str, Any]) -> None:
+    """
+    固定テキストラベルの省略可能な属性を読み込み時に一度だけ補完する
+
+    Args:
+        layout_data: 読み込み直後のレイアウトデータ（その場で更新）
+    """
+    for texts_key in ("page1_texts", "page2_texts"):
+        for text in layout_data.get(texts_key, []):
+            text.setdefault("align", "left")
 
 
 def _calculate_age(birthdate_str: str, reference_date: date | None = None) -> int:
@@ -141,7 +159,7 @@ def _calculate_age(birthdate_str: str, reference_date: date | None = None) -> in
         ValueError: 無効な日付形式
     """
     try:
-        birthdate = datetime.strptime(birthdate_str, "%Y-%m-%d").date()
+        birth_year, birth_month, birth_day = parse_date_ymd(birthdate_str)
     except ValueError as e:
         raise ValueError(f"Invalid birthdate format: {birthdate_str}. Expected YYYY-MM-DD") from e
 
@@ -149,8 +167,8 @@ def _calculate_age(birthdate_str: str, reference_date: date | None = None) -> in
         reference_date = date.today()
 
     # 年齢計算（誕生日前後で判定）
-    age = reference_date.year - birthdate.year
-    if (reference_date.month, reference_date.day) < (birthdate.month, birthdate.day):
+    age = reference_date.year - birth_year
+    if (reference_date.month, reference_date.day) < (birth_month, birth_day):
         age -= 1
 
     return age
@@ -181,7 +199,7 @@ def _format_date(
     """
     # 日付をパース
     try:
-        parsed_date = datetime.strptime(date_str, "%Y-%m-%d").date()
+        year, month, day = parse_date_ymd(date_str)
     except ValueError as e:
         raise ValueError(f"Invalid date format: {date_str}. Expected YYYY-MM-DD") from e
 
@@ -198,11 +216,11 @@ def _format_date(
             return re.sub(r"(\D)(\d)", r"\1 \2", year_part)
         # seireki
         # 西暦の年のみ（例: "1990"）
-        return str(parsed_date.year)
+        return str(year)
     if format_style == "month_only":
-        return str(parsed_date.month)
+        return str(month)
     if format_style == "day_only":
-        return str(parsed_date.day)
+        return str(day)
 
     # 通常のフォーマット
     if format_style in ("full", "short"):
@@ -231,7 +249,7 @@ def _format_date(
     if date_format == "seireki":
         # 西暦形式
         if format_style == "inline" or format_style == "inline_spaced":
-            return f"{parsed_date.year} 年 {parsed_date.month} 月 {parsed_date.day} 日"
+            return f"{year} 年 {month} 月 {day} 日"
         raise ValueError(f"Invalid format_style: {format_style}")
     raise ValueError(f"Invalid date_format: {date_format}. Expected 'seireki' or 'wareki'")
 
@@ -371,8 +389,8 @@ def _draw_texts(
         # 色設定（黒固定）
         c.setFillColorRGB(0, 0, 0)
 
-        # 配置方向に応じた描画
-        align = text.get("align", "left")
+        # 配置方向に応じた描画（alignは_apply_text_defaultsで補完済み）
+        align = text["align"]
         if align == "left":
             c.drawString(text["x"], text["y"], text["text"])
         elif align == "center":
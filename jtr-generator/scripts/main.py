@@ -42,15 +42,6 @@ if str(SCRIPT_DIR) not in sys.path:
 if str(SKILL_ROOT) not in sys.path:
     sys.path.insert(0, str(SKILL_ROOT))
 
-from jtr import (  # noqa: E402
-    generate_career_sheet_pdf,
-    generate_rirekisho_pdf,
-    load_config,
-    resolve_font_paths,
-    validate_and_load_data,
-)
-from jtr.helper.paths import get_assets_path  # noqa: E402
-
 
 def _add_common_options(parser: ArgumentParser) -> None:
     parser.add_argument(
@@ -98,6 +89,9 @@ def _parse_args() -> Namespace:
 
 
 def _build_options(session_options: dict[str, Any] | None) -> dict[str, Any]:
+    from jtr import load_config, resolve_font_paths
+    from jtr.helper.paths import get_assets_path
+
     config_path = get_assets_path("config.yaml")
     config = load_config(config_path if config_path.exists() else None)
     config = resolve_font_paths(config)
@@ -161,6 +155,9 @@ def main(
         FileNotFoundError: ファイルやフォントが存在しない場合
         ValueError: データ形式エラー、バリデーションエラー
     """
+    # jtrパッケージ（reportlab・jsonschemaを含む）は生成時に読み込み、--help等を軽く保つ
+    from jtr import generate_career_sheet_pdf, generate_rirekisho_pdf, validate_and_load_data
+
     options = _build_options(session_options)
 
     make_rirekisho = document_type in ("rirekisho", "both")
@@ -1,5 +1,7 @@
 """和暦変換機能のテスト"""
 
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 from jtr.helper.generation_context import (
@@ -14,6 +16,7 @@ from jtr.helper.japanese_era import (
     format_japanese_date,
     format_japanese_date_or_raw,
     format_seireki_japanese,
+    parse_date_ymd,
 )
 
 
@@ -117,6 +120,27 @@ class TestConvertToWareki:
         with pytest.raises(ValueError):
             convert_to_wareki("2023-13-01")  # 13月は存在しない
 
+    def test_leap_day_validation(self) -> None:
+        """閏年の2月29日は有効、平年の2月29日は無効"""
+        assert convert_to_wareki("2024-02-29") == "令和6年2月29日"
+        assert convert_to_wareki("2000-02-29") == "平成12年2月29日"
+        with pytest.raises(ValueError, match="Invalid date value"):
+            convert_to_wareki("2023-02-29")
+        with pytest.raises(ValueError, match="Invalid date value"):
+            convert_to_wareki("1900-02-29")
+
+    def test_invalid_date_non_digit_fields(self) -> None:
+        """数字以外を含むフィールド（符号・空白）でValueErrorが発生"""
+        for invalid in ("2023-+4-01", "2023- 4-01", "202a-04"):
+            with pytest.raises(ValueError, match="Invalid date value"):
+                convert_to_wareki(invalid)
+
+    def test_invalid_date_non_ascii_digits(self) -> None:
+        """非ASCIIの数字（丸数字・上付き・全角等）でValueErrorが発生"""
+        for invalid in ("2020-①2-01", "2020-12-0²", "２０２０-12-01", "2020-٠٤"):
+            with pytest.raises(ValueError, match="Invalid date value"):
+                convert_to_wareki(invalid)
+
     def test_unsupported_era_before_showa(self) -> None:
         """対応外の年号（昭和より前）でValueErrorが発生"""
         with pytest.raises(ValueError) as exc_info:
@@ -148,6 +172,14 @@ def test_format_seireki_japanese() -> None:
     assert format_seireki_japanese("1990-04", format_style="short") == "1990.4"
 
 
+def test_parse_date_ymd() -> None:
+    assert parse_date_ymd("1990-04-01") == (1990, 4, 1)
+    with pytest.raises(ValueError, match="Invalid date format"):
+        parse_date_ymd("1990-04")
+    with pytest.raises(ValueError, match="Invalid date value"):
+        parse_date_ymd("1990-02-30")
+
+
 def test_format_japanese_date() -> None:
     assert format_japanese_date("2023-04-01", "seireki", format_style="full") == "2023年4月1日"
     assert format_japanese_date("2023-04-01", "seireki", format_style="short") == "2023.4.1"
@@ -155,6 +187,14 @@ def test_format_japanese_date() -> None:
     assert format_japanese_date("2023-04-01", "wareki", format_style="short") == "R5.4.1"
 
 
+def test_format_japanese_date_is_memoized() -> None:
+    format_japanese_date.cache_clear()
+    first = format_japanese_date("2001-02-03", "wareki", format_style="full")
+    second = format_japanese_date("2001-02-03", "wareki", format_style="full")
+    assert first == second == "平成13年2月3日"
+    assert format_japanese_date.cache_info().hits == 1
+
+
 def test_format_japanese_date_or_raw() -> None:
     assert format_japanese_date_or_raw("1990-04-01", "seireki", format_style="full") == (
         "1990年4月1日"
@@ -199,3 +239,15 @@ def test_generation_context_set_override() -> None:
     )
     set_generation_context(context)
     assert get_generation_context().date_format == "seireki"
+
+
+def test_generation_context_is_isolated_per_thread() -> None:
+    init_generation_context({"date_format": "wareki"})
+
+    def worker() -> str:
+        init_generation_context({"date_format": "seireki"})
+        return get_generation_context().date_format
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        assert executor.submit(worker).result() == "seireki"
+    assert get_generation_context().date_format == "wareki"
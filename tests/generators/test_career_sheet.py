@@ -163,3 +163,124 @@ def test_resolve_career_sheet_font_default(monkeypatch: pytest.MonkeyPatch) -> N
     assert career_sheet_generator._resolve_career_sheet_font({"fonts": {}}) == Path(
         "/tmp/default.ttf"
     )
+
+
+def test_styles_and_decorations_are_reused_for_same_palette() -> None:
+    palette = career_sheet_generator._resolve_color_palette({})
+    assert career_sheet_generator._resolve_color_palette({}) is palette
+
+    first = career_sheet_generator._create_styles("Helvetica", palette)
+    second = career_sheet_generator._create_styles("Helvetica", palette)
+    assert first is second
+    assert first["BodyText"].textColor == palette.body_text
+    assert first["Heading2Bar"].parent is first["Heading2"]
+
+    other = career_sheet_generator._resolve_color_palette(
+        {"styles": {"colors": {"main": "#000000"}}}
+    )
+    other_styles = career_sheet_generator._create_styles("Helvetica", other)
+    assert other_styles is not first
+    assert other_styles["Title"].textColor == other.main
+
+    decorations = career_sheet_generator._create_markdown_decorations(palette)
+    assert decorations is career_sheet_generator._create_markdown_decorations(palette)
+    assert decorations["heading2_bar"]["background"] == palette.main
+
+
+def test_contact_table_style_is_shared_between_headers() -> None:
+    palette = career_sheet_generator._resolve_color_palette({})
+    args = ("Helvetica", 11, palette.body_text, palette.sub)
+
+    style = career_sheet_generator._contact_table_style(*args)
+
+    assert career_sheet_generator._contact_table_style(*args) is style
+    assert ("FONT", (0, 0), (-1, -1), "Helvetica", 11) in style.getCommands()
+
+
+def test_plain_paragraph_matches_parsed_paragraph_for_plain_text() -> None:
+    from reportlab.lib.styles import ParagraphStyle
+    from reportlab.platypus import Paragraph
+
+    style = ParagraphStyle("Bullet", fontName="Helvetica", fontSize=11)
+    text = "• 2020年4月 基本情報技術者"
+
+    plain = career_sheet_generator._plain_paragraph(text, style)
+    parsed = Paragraph(text, style)
+
+    assert plain.wrap(200, 100) == parsed.wrap(200, 100)
+    assert [vars(f) for f in plain.frags] == [vars(f) for f in parsed.frags]
+
+
+def test_plain_paragraph_keeps_markup_characters_literal() -> None:
+    from reportlab.lib.styles import ParagraphStyle
+
+    style = ParagraphStyle("Bullet", fontName="Helvetica", fontSize=11)
+
+    paragraph = career_sheet_generator._plain_paragraph("AT&T <認定>", style)
+
+    assert "".join(f.text for f in paragraph.frags) == "AT&T <認定>"
+
+
+def test_contact_cell_matches_stripped_label() -> None:
+    for value in ("山田 太郎", "", "  ", "03-1234-5678 "):
+        assert career_sheet_generator._contact_cell("氏名", value) == f"氏名: {value}".strip()
+
+
+def test_whitespace_only_markdown_skips_body(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """空白のみのMarkdownでは本文の変換を行わない"""
+    from jtr.helper.fonts import find_default_font
+
+    def fail(*_args: object) -> list[object]:
+        raise AssertionError("markdown_to_flowables should not be called")
+
+    monkeypatch.setattr(career_sheet_generator, "markdown_to_flowables", fail)
+    options = {"fonts": {"mincho": str(find_default_font())}}
+    output_path = tmp_path / "blank.pdf"
+
+    generate_career_sheet_pdf({"personal_info": {}}, " \n\t　\n", options, output_path)
+
+    assert output_path.stat().st_size > 0
+
+
+def test_failed_generation_keeps_existing_output(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """PDFの書き出しに失敗しても既存の出力ファイルを壊さない"""
+    from reportlab.pdfbase.pdfdoc import PDFDocument
+
+    from jtr.helper.fonts import find_default_font
+
+    def fail(*_args: object) -> bytes:
+        raise ValueError("broken pdf")
+
+    monkeypatch.setattr(PDFDocument, "GetPDFData", fail)
+    options = {"fonts": {"mincho": str(find_default_font())}}
+    output_path = tmp_path / "career_sheet.pdf"
+    output_path.write_bytes(b"previous")
+
+    with pytest.raises(ValueError, match="broken pdf"):
+        generate_career_sheet_pdf({"personal_info": {}}, "# 本文", options, output_path)
+
+    assert output_path.read_bytes() == b"previous"
+    assert [p.name for p in tmp_path.iterdir()] == ["career_sheet.pdf"]
+
+
+def test_markup_characters_in_data_render_literally(tmp_path: Path) -> None:
+    """データ中の「&」「<」「>」はマークアップとして解釈せず、そのまま描画する"""
+    import pypdf
+
+    from jtr.helper.fonts import find_default_font
+
+    output_path = tmp_path / "markup.pdf"
+    rirekisho_data = {
+        "personal_info": {},
+        "qualifications": [{"date": "2020-04", "name": "AT&T <b>認定</b> &amp; R>D"}],
+    }
+    options = {"fonts": {"mincho": str(find_default_font())}}
+
+    generate_career_sheet_pdf(rirekisho_data, "", options, output_path)
+
+    text = pypdf.PdfReader(output_path).pages[0].extract_text()
+    assert "AT&T <b>認定</b> &amp; R>D" in text
@@ -192,3 +192,14 @@ def test_resolve_shared_font_default(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(rirekisho_generator, "find_default_font", lambda: Path("/tmp/default.ttf"))
 
     assert rirekisho_generator._resolve_shared_font({"fonts": {}}) == Path("/tmp/default.ttf")
+
+
+def test_apply_text_defaults_fills_missing_align() -> None:
+    layout_data = {
+        "page1_texts": [{"text": "氏名"}, {"text": "年齢", "align": "right"}],
+        "page1_lines": [],
+    }
+
+    rirekisho_generator._apply_text_defaults(layout_data)
+
+    assert [text["align"] for text in layout_data["page1_texts"]] == ["left", "right"]
@@ -1,11 +1,17 @@
 """skill.scripts.jtr.layout.anchors モジュールのテスト"""
 
+import subprocess
+import sys
+from pathlib import Path
+
 import pytest
 
+from jtr.layout import anchors
 from jtr.layout.anchors import (
     _cluster_positions,
     _collect_line_positions,
     _nearest_position,
+    _nearest_positions,
     build_text_anchors,
     resolve_texts_from_anchors,
 )
@@ -41,6 +47,13 @@ class TestClusterPositions:
         assert len(result) == 2
         assert result[0] < result[1]  # ソート済み
 
+    def test_large_input_matches_pure_python(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """大きな入力（NumPy経路）でも純Python版と同一の結果になる"""
+        values = [round(100.0 + (i * 7 % 50) * 0.35 + (i % 3) * 0.05, 2) for i in range(200)]
+        result = _cluster_positions(values, tol=0.2)
+        monkeypatch.setattr(anchors, "_load_numpy", lambda: None)
+        assert result == _cluster_positions(values, tol=0.2)
+
 
 class TestCollectLinePositions:
     """_collect_line_positions関数のテスト"""
@@ -106,6 +119,37 @@ class TestNearestPosition:
         positions = [100.0]
         assert _nearest_position(200.0, positions) == 100.0
 
+    def test_equidistant_prefers_lower(self) -> None:
+        """等距離の場合は小さい方の位置が返る"""
+        positions = [50.0, 100.0, 150.0]
+        assert _nearest_position(75.0, positions) == 50.0
+
+    def test_outside_range(self) -> None:
+        """範囲外の値は端の位置が返る"""
+        positions = [50.0, 100.0, 150.0]
+        assert _nearest_position(-10.0, positions) == 50.0
+        assert _nearest_position(999.0, positions) == 150.0
+
+
+class TestNearestPositions:
+    """_nearest_positions関数のテスト"""
+
+    def test_empty_values(self) -> None:
+        """値が空なら位置が空でも空リストが返る"""
+        assert _nearest_positions([], []) == []
+
+    def test_no_positions(self) -> None:
+        """値があり位置が空ならValueErrorが発生"""
+        with pytest.raises(ValueError, match="No line positions found"):
+            _nearest_positions([1.0], [])
+
+    def test_batch_matches_scalar(self) -> None:
+        """一括処理（NumPy経路）の結果が_nearest_positionと一致する"""
+        positions = [10.0, 20.0, 30.0, 40.0]
+        values = [i * 0.5 for i in range(100)]
+        expected = [_nearest_position(value, positions) for value in values]
+        assert _nearest_positions(values, positions) == expected
+
 
 class TestBuildTextAnchors:
     """build_text_anchors関数のテスト"""
@@ -265,3 +309,16 @@ class TestResolveTextsFromAnchors:
         # 最近傍の罫線（10.2, 49.8）にスナップされる
         assert abs(result[0]["x"] - 10.2) < 0.01
         assert abs(result[0]["y"] - 49.8) < 0.01
+
+
+def test_career_sheet_generator_does_not_import_numpy() -> None:
+    """PDF生成経路ではnumpyを読み込まない（anchorsの初回利用時まで遅延）"""
+    code = "import sys; import jtr.career_sheet_generator; print('numpy' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=Path(anchors.__file__).parents[2],
+    )
+    assert result.stdout.strip() == "False"
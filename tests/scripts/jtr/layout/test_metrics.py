@@ -31,6 +31,86 @@ class TestRegisterFont:
         with pytest.raises(FileNotFoundError, match="フォントファイルが見つかりません"):
             register_font(non_existent)
 
+    def test_find_default_font_is_cached(self) -> None:
+        """デフォルトフォントの探索結果はキャッシュされる"""
+        from jtr.helper.fonts import find_default_font
+
+        assert find_default_font() is find_default_font()
+        assert find_default_font.cache_info().hits >= 1
+
+    def test_register_font_skips_reparse_for_same_file(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """同じフォントファイルの再登録ではTTFontを再生成しない"""
+        from jtr.helper import fonts
+        from jtr.helper.fonts import find_default_font
+
+        font_path = find_default_font()
+        register_font(font_path)
+
+        created: list[str] = []
+        original = fonts.TTFont
+
+        def counting_ttfont(name: str, filename: str) -> object:
+            created.append(name)
+            return original(name, filename)
+
+        def fail_registered_names() -> list[str]:
+            raise AssertionError("getRegisteredFontNames should not be called")
+
+        monkeypatch.setattr(fonts, "TTFont", counting_ttfont)
+        monkeypatch.setattr(fonts.pdfmetrics, "getRegisteredFontNames", fail_registered_names)
+
+        assert register_font(font_path) == font_path.stem
+        assert created == []
+
+        # pdfmetrics側から登録が消えている場合は登録し直す
+        monkeypatch.delitem(fonts.pdfmetrics._fonts, font_path.stem)
+
+        assert register_font(font_path) == font_path.stem
+        assert created == [font_path.stem]
+
+    def test_register_font_parses_once_under_concurrency(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """複数スレッドから同時に登録してもTTFontの解析は1回だけ"""
+        import shutil
+        from concurrent.futures import ThreadPoolExecutor
+
+        from jtr.helper import fonts
+        from jtr.helper.fonts import find_default_font
+
+        font_path = tmp_path / "ConcurrentFont.ttf"
+        shutil.copyfile(find_default_font(), font_path)
+        created: list[str] = []
+        original = fonts.TTFont
+
+        def counting_ttfont(name: str, filename: str) -> object:
+            created.append(name)
+            return original(name, filename)
+
+        monkeypatch.setattr(fonts, "TTFont", counting_ttfont)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            names = list(executor.map(register_font, [font_path] * 8))
+
+        assert names == ["ConcurrentFont"] * 8
+        assert created == ["ConcurrentFont"]
+
+    def test_register_font_reports_deleted_file(self, tmp_path: Path) -> None:
+        """登録済みでもフォントファイルが削除されていればFileNotFoundErrorが発生"""
+        import shutil
+
+        from jtr.helper.fonts import find_default_font
+
+        font_path = tmp_path / "DeletedFont.ttf"
+        shutil.copyfile(find_default_font(), font_path)
+        register_font(font_path)
+        font_path.unlink()
+
+        with pytest.raises(FileNotFoundError, match="フォントファイルが見つかりません"):
+            register_font(font_path)
+
 
 class TestGetFontMetrics:
     """get_font_metrics関数のテスト"""
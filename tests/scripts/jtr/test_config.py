@@ -1,5 +1,7 @@
 """skill.scripts.jtr.helper.config モジュールのテスト"""
 
+import subprocess
+import sys
 from pathlib import Path
 from unittest.mock import patch
 
@@ -78,6 +80,24 @@ class TestLoadConfig:
         assert result["options"] == {}
         assert result["fonts"] == {}
 
+    def test_load_config_is_cached_until_file_changes(self, tmp_path: Path) -> None:
+        """同じファイルは再パースせず、返す辞書は呼び出しごとに独立している"""
+        from jtr.helper.config import _load_config_file
+
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("options:\n  date_format: wareki\n", encoding="utf-8")
+        _load_config_file.cache_clear()
+
+        first = load_config(config_file)
+        first["options"]["date_format"] = "mutated"
+        second = load_config(config_file)
+
+        assert second["options"]["date_format"] == "wareki"
+        assert _load_config_file.cache_info().hits == 1
+
+        config_file.write_text("options:\n  date_format: seireki\n", encoding="utf-8")
+        assert load_config(config_file)["options"]["date_format"] == "seireki"
+
 
 class TestResolveFontPaths:
     """resolve_font_paths関数のテスト"""
@@ -151,3 +171,21 @@ class TestResolveFontPaths:
             result = resolve_font_paths(config)
 
         assert result["fonts"]["mincho"] == str(default_font)
+
+
+def test_import_config_does_not_load_reportlab() -> None:
+    """jtr.helper.configの読み込みでreportlab・jsonschemaを読み込まない"""
+    import jtr
+
+    code = (
+        "import sys; import jtr.helper.config; "
+        "print(any(m.split('.')[0] in ('reportlab', 'jsonschema') for m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=Path(jtr.__file__).parent.parent,
+    )
+    assert result.stdout.strip() == "False"
@@ -70,3 +70,10 @@ def test_get_font_metrics_uses_reportlab_defaults() -> None:
     assert set(metrics) == {"ascent", "descent", "height"}
     assert metrics["ascent"] > 0
     assert metrics["height"] == metrics["ascent"] - metrics["descent"]
+
+
+def test_get_font_metrics_returns_independent_dicts() -> None:
+    first = get_font_metrics("Helvetica", 10)
+    first["ascent"] = -1.0
+    second = get_font_metrics("Helvetica", 10)
+    assert second["ascent"] > 0
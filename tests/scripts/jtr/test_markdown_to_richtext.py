@@ -285,3 +285,146 @@ class TestMarkdownToFlowables:
 
         assert len(flowables) == 1
         assert isinstance(flowables[0], Table)
+
+
+def test_markdown_ast_is_cached(sample_styles: dict[str, ParagraphStyle]) -> None:
+    """同じMarkdownは一度だけ解析され、Flowableは呼び出しごとに新しく生成される"""
+    from jtr.markdown_to_richtext import _parse_markdown, clear_markdown_cache
+
+    clear_markdown_cache()
+    first = markdown_to_flowables("## 見出し\n\n本文", sample_styles)
+    second = markdown_to_flowables("## 見出し\n\n本文", sample_styles)
+
+    assert _parse_markdown.cache_info().hits == 1
+    assert len(first) == len(second)
+    assert all(a is not b for a, b in zip(first, second, strict=True))
+
+
+def test_inline_markup_nesting_and_escape(sample_styles: dict[str, ParagraphStyle]) -> None:
+    """入れ子のインライン装飾と特殊文字のエスケープ"""
+    flowables = markdown_to_flowables(
+        "**太字 *斜体* ~~消~~** `a<b>&c` [リンク](https://example.com/?a=1&b=2)",
+        sample_styles,
+    )
+
+    assert flowables[0].text == (
+        "<b>太字 <i>斜体</i> <strike>消</strike></b> "
+        '<font face="Courier">a&lt;b&gt;&amp;c</font> '
+        '<a href="https://example.com/?a=1&amp;b=2">リンク</a>'
+    )
+
+
+def test_derived_styles_are_shared(sample_styles: dict[str, ParagraphStyle]) -> None:
+    """同じ深さの箇条書き・引用は同一の派生スタイルを共有する"""
+    markdown = "- a\n  - b\n  - c\n\n> q1\n\n- d\n  - e\n\n> q2\n"
+    flowables = markdown_to_flowables(markdown, sample_styles)
+    nested = [f for f in flowables if f.style.name == "BulletDepth1"]
+    quotes = [f for f in flowables if f.style.name == "BlockQuote"]
+
+    assert len(nested) == 3
+    assert len({id(f.style) for f in nested}) == 1
+    assert nested[0].style.leftIndent == pytest.approx(10 + 4 * 72 / 25.4)
+    assert len(quotes) == 2
+    assert quotes[0].style is quotes[1].style
+
+    sample_styles["Bullet"].leftIndent = 20
+    changed = markdown_to_flowables("- a\n  - b\n", sample_styles)
+    assert changed[1].style.leftIndent == pytest.approx(20 + 4 * 72 / 25.4)
+
+
+def test_decorations_are_applied(sample_styles: dict[str, ParagraphStyle]) -> None:
+    """装飾設定（引用・コード・水平線）が前処理を経て各Flowableに反映される"""
+    decorations = {
+        "thematic_break": {"color": "#ff0000", "thickness": "2", "space_before": 3},
+        "blockquote": {"indent": 5, "text_color": "#00ff00"},
+        "code_block": {"font_size": 8, "background": "#eeeeee"},
+    }
+    flowables = markdown_to_flowables(
+        "---\n\n> 引用\n\n```\ncode\n```\n", sample_styles, decorations
+    )
+
+    rule, quote, code = flowables
+    assert isinstance(rule, HRFlowable)
+    assert rule.lineWidth == 2.0
+    assert rule.color.hexval() == "0xff0000"
+    assert rule.spaceBefore == 3.0
+    assert quote.style.leftIndent == 5.0
+    assert quote.style.textColor.hexval() == "0x00ff00"
+    assert isinstance(code, Preformatted)
+    assert code.style.fontSize == 8.0
+    assert code.style.leading == sample_styles["BodyText"].leading
+    assert code.style.backColor.hexval() == "0xeeeeee"
+
+
+def test_inline_line_breaks(sample_styles: dict[str, ParagraphStyle]) -> None:
+    """強制改行・ソフト改行のインライン変換"""
+    flowables = markdown_to_flowables("一行目  \n二行目\n三行目", sample_styles)
+
+    assert flowables[0].text == "一行目<br/>二行目 三行目"
+
+
+def test_heading_bar_rewrap_reuses_paragraph(
+    sample_styles: dict[str, ParagraphStyle],
+    sample_decorations: dict[str, dict[str, object]],
+) -> None:
+    """HeadingBarは再wrap時にParagraphを作り直さず、幅に応じて高さだけ再計算する"""
+    bar = markdown_to_flowables("## " + "長い見出し" * 20, sample_styles, sample_decorations)[0]
+    paragraph = bar._paragraph
+
+    _, wide_height = bar.wrap(500, 1000)
+    _, narrow_height = bar.wrap(100, 1000)
+
+    assert bar._paragraph is paragraph
+    assert narrow_height > wide_height
+
+
+def test_section_indent_insets(sample_styles: dict[str, ParagraphStyle]) -> None:
+    """section_indent_stepに応じて見出し配下のブロックがインセットされる"""
+    from jtr.markdown_to_richtext import InsetFlowable
+
+    markdown = "## 章\n\n本文\n\n### 節\n\n- 項目\n"
+    flowables = markdown_to_flowables(markdown, sample_styles, {"section_indent_step": 5})
+    insets = [
+        (type(f.flowable).__name__, f.inset_left) for f in flowables if isinstance(f, InsetFlowable)
+    ]
+
+    assert insets == [("Paragraph", 5.0), ("Paragraph", 5.0), ("Paragraph", 10.0)]
+    plain = markdown_to_flowables(markdown, sample_styles)
+    assert not any(isinstance(f, InsetFlowable) for f in plain)
+
+
+def test_table_cells_with_empty_values(sample_styles: dict[str, ParagraphStyle]) -> None:
+    """空セルを含むテーブルは空文字のセルとして変換される"""
+    markdown = "| 技術 | 年数 |\n|---|---|\n| **Python** |  |\n|  | 3 |"
+    table = markdown_to_flowables(markdown, sample_styles)[0]
+
+    assert isinstance(table, Table)
+    assert table._cellvalues == [["技術", "年数"], ["<b>Python</b>", ""], ["", "3"]]
+
+
+def test_hex_colors_are_parsed_once(
+    sample_styles: dict[str, ParagraphStyle],
+    sample_decorations: dict[str, dict[str, object]],
+) -> None:
+    """同じ色指定は変換をまたいで同一のColorを使い回す"""
+    first = markdown_to_flowables("## A", sample_styles, sample_decorations)[0]
+    second = markdown_to_flowables("## B", sample_styles, sample_decorations)[0]
+
+    assert first.background is second.background
+    assert first.background.hexval() == "0x1a365d"
+
+
+def test_list_markers(sample_styles: dict[str, ParagraphStyle]) -> None:
+    """番号付きリスト・タスクリスト・通常の箇条書きのマーカー"""
+    markdown = "1. 一\n2. 二\n\n- [x] 済\n- [ ] 未\n\n- 点\n"
+    texts = [f.text for f in markdown_to_flowables(markdown, sample_styles)]
+
+    assert texts == ["1. 一", "2. 二", "• [x] 済", "• [ ] 未", "• 点"]
+
+
+def test_list_item_with_multiple_paragraphs(sample_styles: dict[str, ParagraphStyle]) -> None:
+    """複数段落を持つ箇条書き項目は空白区切りで1つの項目にまとまる"""
+    markdown = "- 一段落目\n\n  二段落目\n- 単独\n"
+    texts = [f.text for f in markdown_to_flowables(markdown, sample_styles)]
+
+    assert texts == ["• 一段落目 二段落目", "• 単独"]
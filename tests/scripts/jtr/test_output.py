@@ -0,0 +1,75 @@
+"""skill.scripts.jtr.helper.output モジュールのテスト"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from jtr.helper import output
+from jtr.helper.output import write_bytes_atomic
+
+
+def test_write_bytes_atomic_replaces_file(tmp_path: Path) -> None:
+    """出力先を置き換え、一時ファイルを残さない"""
+    target = tmp_path / "out.pdf"
+    target.write_bytes(b"old")
+
+    write_bytes_atomic(target, b"new")
+
+    assert target.read_bytes() == b"new"
+    assert [p.name for p in tmp_path.iterdir()] == ["out.pdf"]
+
+
+def test_write_bytes_atomic_uses_unique_temp_names(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """他の書き込みの一時ファイルを上書き・削除しない"""
+    target = tmp_path / "out.pdf"
+    other_tmp = tmp_path / ".out.pdf.tmp"
+    other_tmp.write_bytes(b"other writer")
+    temp_names: list[str] = []
+    original_replace = os.replace
+
+    def recording_replace(src: Path, dst: Path) -> None:
+        temp_names.append(Path(src).name)
+        original_replace(src, dst)
+
+    monkeypatch.setattr(output.os, "replace", recording_replace)
+
+    write_bytes_atomic(target, b"first")
+    write_bytes_atomic(target, b"second")
+
+    assert target.read_bytes() == b"second"
+    assert other_tmp.read_bytes() == b"other writer"
+    assert len(set(temp_names)) == 2
+    assert all(name.startswith(".out.pdf.") for name in temp_names)
+
+
+def test_write_bytes_atomic_keeps_umask_permissions(tmp_path: Path) -> None:
+    """通常のファイル作成と同じパーミッションになる"""
+    reference = tmp_path / "reference.pdf"
+    reference.write_bytes(b"")
+    target = tmp_path / "out.pdf"
+
+    write_bytes_atomic(target, b"data")
+
+    assert target.stat().st_mode == reference.stat().st_mode
+
+
+def test_write_bytes_atomic_cleans_up_on_failure(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """置き換えに失敗した場合は一時ファイルを削除し、出力先を変更しない"""
+    target = tmp_path / "out.pdf"
+    target.write_bytes(b"old")
+
+    def failing_replace(src: Path, dst: Path) -> None:
+        raise OSError("replace failed")
+
+    monkeypatch.setattr(output.os, "replace", failing_replace)
+
+    with pytest.raises(OSError, match="replace failed"):
+        write_bytes_atomic(target, b"new")
+
+    assert target.read_bytes() == b"old"
+    assert [p.name for p in tmp_path.iterdir()] == ["out.pdf"]
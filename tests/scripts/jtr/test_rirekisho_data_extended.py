@@ -7,12 +7,100 @@ import jsonschema
 import pytest
 
 from jtr.rirekisho_data import (
+    _is_data_string,
+    _load_schema,
+    _load_yaml,
+    _parse_data_string,
+    _validator_for,
     format_validation_error_ja,
     load_validated_data,
     validate_and_load_data,
 )
 
 
+def test_yaml_timestamps_load_as_strings() -> None:
+    """YAMLの日付・日時はdate/datetimeに変換されず、ISO形式の文字列として読み込まれる"""
+    text = (
+        "birthdate: 1990-04-01\n"
+        "history:\n"
+        "  - {date: 2020-04-01, note: 入社}\n"
+        "  - 2021-01-02 03:04:05\n"
+        "quoted: '2020-04-01'\n"
+        "count: 2\n"
+    )
+
+    assert _load_yaml(text) == {
+        "birthdate": "1990-04-01",
+        "history": [{"date": "2020-04-01", "note": "入社"}, "2021-01-02T03:04:05"],
+        "quoted": "2020-04-01",
+        "count": 2,
+    }
+
+
+def test_is_data_string_skips_filesystem_for_obvious_data(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """データと判別できる文字列はファイルシステムを確認せずに判定する"""
+    existing = tmp_path / "data.yaml"
+    existing.write_text("name: x\n", encoding="utf-8")
+    assert _is_data_string(str(existing)) is False
+    assert _is_data_string(str(tmp_path / "missing.yaml")) is True
+    assert _is_data_string("x" * 5000) is True
+
+    def fail_exists(self: Path) -> bool:
+        raise AssertionError("filesystem probed")
+
+    monkeypatch.setattr(Path, "exists", fail_exists)
+    assert _is_data_string("name: 山田") is True
+    assert _is_data_string('{"name": "山田"}') is True
+    assert _is_data_string("a\nb") is True
+
+
+def test_load_schema_is_cached() -> None:
+    """スキーマは一度だけ読み込まれ、以降は同じオブジェクトが返る"""
+    _load_schema.cache_clear()
+    first = _load_schema("rirekisho_schema.json")
+    second = _load_schema("rirekisho_schema.json")
+
+    assert first is second
+    assert _load_schema.cache_info().hits == 1
+    with pytest.raises(FileNotFoundError, match="Schema file not found"):
+        _load_schema("missing_schema.json")
+
+
+def test_validator_is_reused_across_validations() -> None:
+    """同じスキーマのバリデータは呼び出しをまたいで再利用される"""
+    _validator_for.cache_clear()
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            validate_and_load_data("name: only\n")
+
+    assert _validator_for.cache_info().misses == 1
+    assert _validator_for.cache_info().hits == 1
+
+
+def test_parse_data_string_sniffs_json(monkeypatch: pytest.MonkeyPatch) -> None:
+    """JSON文字列はYAMLパーサーを通さず、YAMLはフロー形式も含めて読み込める"""
+    import jtr.rirekisho_data as module
+
+    calls: list[str] = []
+    original = module._load_yaml
+
+    def tracking_load_yaml(stream: str) -> object:
+        calls.append(stream)
+        return original(stream)
+
+    monkeypatch.setattr(module, "_load_yaml", tracking_load_yaml)
+
+    assert _parse_data_string(' {"a": [1, 2]}') == {"a": [1, 2]}
+    assert calls == []
+    assert _parse_data_string("[a, b]") == ["a", "b"]
+    assert _parse_data_string("day: 2020-04-01\n") == {"day": "2020-04-01"}
+    assert len(calls) == 2
+    with pytest.raises(json.JSONDecodeError):
+        _parse_data_string("key: [unclosed")
+
+
 class TestFormatValidationErrorJa:
     """format_validation_error_ja関数のテスト"""
 
@@ -113,6 +201,46 @@ class TestFormatValidationErrorJa:
             assert "データ検証エラー" in result
             assert "schemas/rirekisho_schema.json" in result
 
+    def test_format_nested_error_uses_absolute_path(self) -> None:
+        """anyOf配下のエラーもルートからのフィールドパスで表示"""
+        schema = {
+            "type": "object",
+            "properties": {
+                "education": {
+                    "type": "array",
+                    "items": {
+                        "anyOf": [
+                            {"type": "object", "properties": {"school": {"type": "string"}}},
+                            {"type": "string"},
+                        ]
+                    },
+                }
+            },
+        }
+        validator = jsonschema.Draft202012Validator(schema)
+        error = jsonschema.exceptions.best_match(
+            validator.iter_errors({"education": [{"school": 1}]})
+        )
+        assert error is not None
+
+        result = format_validation_error_ja(error)
+
+        assert "対象フィールド: education.0.school" in result
+
+    def test_format_non_date_format_error_uses_generic(self) -> None:
+        """date以外のformat違反は汎用フォーマットで整形"""
+        error = jsonschema.ValidationError(
+            "'x' is not a 'email'",
+            validator="format",
+            schema={"type": "string", "format": "email"},
+            path=["email"],
+        )
+
+        result = format_validation_error_ja(error)
+
+        assert "データ検証エラー: 'x' is not a 'email'" in result
+        assert "対象フィールド: email" in result
+
 
 class TestValidateAndLoadData:
     """validate_and_load_data関数のテスト"""
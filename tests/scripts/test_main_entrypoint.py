@@ -7,6 +7,8 @@ from typing import Any
 import main as scripts_main
 import pytest
 
+import jtr
+
 
 def _minimal_config() -> dict[str, Any]:
     return {"options": {"date_format": "seireki", "paper_size": "A4"}, "fonts": {}}
@@ -16,9 +18,9 @@ def test_rirekisho_branch_uses_session_overrides(monkeypatch: Any, tmp_path: Pat
     module = reload(scripts_main)
     captured: dict[str, Any] = {}
 
-    monkeypatch.setattr(module, "load_config", lambda _path: _minimal_config())
-    monkeypatch.setattr(module, "resolve_font_paths", lambda config: config)
-    monkeypatch.setattr(module, "validate_and_load_data", lambda input_data: {"source": input_data})
+    monkeypatch.setattr(jtr, "load_config", lambda _path: _minimal_config())
+    monkeypatch.setattr(jtr, "resolve_font_paths", lambda config: config)
+    monkeypatch.setattr(jtr, "validate_and_load_data", lambda input_data: {"source": input_data})
 
     def fake_generate_rirekisho_pdf(
         data: dict[str, Any], options: dict[str, Any], output_path: Path
@@ -27,7 +29,7 @@ def test_rirekisho_branch_uses_session_overrides(monkeypatch: Any, tmp_path: Pat
         captured["options"] = options
         captured["output_path"] = output_path
 
-    monkeypatch.setattr(module, "generate_rirekisho_pdf", fake_generate_rirekisho_pdf)
+    monkeypatch.setattr(jtr, "generate_rirekisho_pdf", fake_generate_rirekisho_pdf)
 
     destination = tmp_path / "rirekisho.pdf"
     result = module.main(
@@ -54,9 +56,9 @@ def test_career_sheet_branch_delegates(monkeypatch: Any, tmp_path: Path) -> None
     module = reload(scripts_main)
     captured: dict[str, Any] = {}
 
-    monkeypatch.setattr(module, "load_config", lambda _path: _minimal_config())
-    monkeypatch.setattr(module, "resolve_font_paths", lambda config: config)
-    monkeypatch.setattr(module, "validate_and_load_data", lambda payload: {"payload": payload})
+    monkeypatch.setattr(jtr, "load_config", lambda _path: _minimal_config())
+    monkeypatch.setattr(jtr, "resolve_font_paths", lambda config: config)
+    monkeypatch.setattr(jtr, "validate_and_load_data", lambda payload: {"payload": payload})
 
     def fake_generate(
         rirekisho_data: dict[str, Any],
@@ -69,7 +71,7 @@ def test_career_sheet_branch_delegates(monkeypatch: Any, tmp_path: Path) -> None
         captured["options"] = options
         captured["output_path"] = output_path
 
-    monkeypatch.setattr(module, "generate_career_sheet_pdf", fake_generate)
+    monkeypatch.setattr(jtr, "generate_career_sheet_pdf", fake_generate)
 
     destination = tmp_path / "career.pdf"
     result = module.main(
@@ -92,9 +94,9 @@ def test_both_branch_generates_two_pdfs(monkeypatch: Any, tmp_path: Path) -> Non
     module = reload(scripts_main)
     captured: dict[str, Any] = {"rirekisho": [], "career": []}
 
-    monkeypatch.setattr(module, "load_config", lambda _path: _minimal_config())
-    monkeypatch.setattr(module, "resolve_font_paths", lambda config: config)
-    monkeypatch.setattr(module, "validate_and_load_data", lambda payload: {"payload": payload})
+    monkeypatch.setattr(jtr, "load_config", lambda _path: _minimal_config())
+    monkeypatch.setattr(jtr, "resolve_font_paths", lambda config: config)
+    monkeypatch.setattr(jtr, "validate_and_load_data", lambda payload: {"payload": payload})
 
     def fake_generate_rirekisho(
         data: dict[str, Any], options: dict[str, Any], output_path: Path
@@ -109,8 +111,8 @@ def test_both_branch_generates_two_pdfs(monkeypatch: Any, tmp_path: Path) -> Non
     ) -> None:
         captured["career"].append((rirekisho_data, markdown_text, options, output_path))
 
-    monkeypatch.setattr(module, "generate_rirekisho_pdf", fake_generate_rirekisho)
-    monkeypatch.setattr(module, "generate_career_sheet_pdf", fake_generate_career)
+    monkeypatch.setattr(jtr, "generate_rirekisho_pdf", fake_generate_rirekisho)
+    monkeypatch.setattr(jtr, "generate_career_sheet_pdf", fake_generate_career)
     monkeypatch.setattr(
         module,
         "_build_both_output_paths",
@@ -155,8 +157,8 @@ def test_parse_args_builds_session_options(monkeypatch: Any) -> None:
 def test_build_options_applies_font(monkeypatch: Any) -> None:
     module = reload(scripts_main)
 
-    monkeypatch.setattr(module, "load_config", lambda _path: _minimal_config())
-    monkeypatch.setattr(module, "resolve_font_paths", lambda config: config)
+    monkeypatch.setattr(jtr, "load_config", lambda _path: _minimal_config())
+    monkeypatch.setattr(jtr, "resolve_font_paths", lambda config: config)
 
     options = module._build_options({"font": "gothic"})
 
@@ -201,8 +203,8 @@ def test_build_both_output_paths(tmp_path: Path) -> None:
 def test_invalid_document_type_raises(monkeypatch: Any) -> None:
     module = reload(scripts_main)
 
-    monkeypatch.setattr(module, "load_config", lambda _path: _minimal_config())
-    monkeypatch.setattr(module, "resolve_font_paths", lambda config: config)
+    monkeypatch.setattr(jtr, "load_config", lambda _path: _minimal_config())
+    monkeypatch.setattr(jtr, "resolve_font_paths", lambda config: config)
 
     with pytest.raises(ValueError):
         module.main(input_data="rirekisho.yaml", document_type="unknown")
@@ -211,9 +213,9 @@ def test_invalid_document_type_raises(monkeypatch: Any) -> None:
 def test_both_output_dir_suffix_raises(monkeypatch: Any, tmp_path: Path) -> None:
     module = reload(scripts_main)
 
-    monkeypatch.setattr(module, "load_config", lambda _path: _minimal_config())
-    monkeypatch.setattr(module, "resolve_font_paths", lambda config: config)
-    monkeypatch.setattr(module, "validate_and_load_data", lambda payload: {"payload": payload})
+    monkeypatch.setattr(jtr, "load_config", lambda _path: _minimal_config())
+    monkeypatch.setattr(jtr, "resolve_font_paths", lambda config: config)
+    monkeypatch.setattr(jtr, "validate_and_load_data", lambda payload: {"payload": payload})
 
     with pytest.raises(ValueError):
         module.main(
@@ -230,9 +232,9 @@ def test_both_output_dir_file_raises(monkeypatch: Any, tmp_path: Path) -> None:
     marker = tmp_path / "outputs"
     marker.write_text("not a directory", encoding="utf-8")
 
-    monkeypatch.setattr(module, "load_config", lambda _path: _minimal_config())
-    monkeypatch.setattr(module, "resolve_font_paths", lambda config: config)
-    monkeypatch.setattr(module, "validate_and_load_data", lambda payload: {"payload": payload})
+    monkeypatch.setattr(jtr, "load_config", lambda _path: _minimal_config())
+    monkeypatch.setattr(jtr, "resolve_font_paths", lambda config: config)
+    monkeypatch.setattr(jtr, "validate_and_load_data", lambda payload: {"payload": payload})
 
     with pytest.raises(ValueError):
         module.main(
@@ -246,9 +248,9 @@ def test_both_output_dir_file_raises(monkeypatch: Any, tmp_path: Path) -> None:
 def test_career_sheet_requires_markdown_after_load(monkeypatch: Any) -> None:
     module = reload(scripts_main)
 
-    monkeypatch.setattr(module, "load_config", lambda _path: _minimal_config())
-    monkeypatch.setattr(module, "resolve_font_paths", lambda config: config)
-    monkeypatch.setattr(module, "validate_and_load_data", lambda payload: {"payload": payload})
+    monkeypatch.setattr(jtr, "load_config", lambda _path: _minimal_config())
+    monkeypatch.setattr(jtr, "resolve_font_paths", lambda config: config)
+    monkeypatch.setattr(jtr, "validate_and_load_data", lambda payload: {"payload": payload})
     monkeypatch.setattr(module, "_load_markdown", lambda _content: None)
 
     with pytest.raises(ValueError):
@@ -257,3 +259,20 @@ def test_career_sheet_requires_markdown_after_load(monkeypatch: Any) -> None:
             document_type="career_sheet",
             markdown_content="body",
         )
+
+
+def test_help_does_not_import_jtr_dependencies() -> None:
+    """--help ではreportlab・jsonschemaを読み込まない"""
+    import subprocess
+    import sys
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", scripts_main.__file__, "--help"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert "usage:" in result.stdout
+    assert "reportlab" not in result.stderr
+    assert "jsonschema" not in result.stderr
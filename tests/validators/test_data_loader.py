@@ -4,7 +4,7 @@ from pathlib import Path
 
 import pytest
 
-from jtr.rirekisho_data import load_rirekisho_data
+from jtr.rirekisho_data import load_rirekisho_batch, load_rirekisho_data
 
 jsonschema = pytest.importorskip("jsonschema")
 ValidationError = jsonschema.ValidationError
@@ -119,3 +119,64 @@ class TestLoadRirekishoData:
         # 存在する場合はValueErrorを期待
         with pytest.raises((ValueError, FileNotFoundError)):
             load_rirekisho_data(file_path)
+
+
+class TestLoadRirekishoBatch:
+    """load_rirekisho_batch関数のテスト"""
+
+    def test_batch_preserves_order(self, valid_fixtures_dir: Path) -> None:
+        """正常系: 並列読み込みの結果は入力順に並び、逐次読み込みと一致する"""
+        paths = [valid_fixtures_dir / name for name in ("full.yaml", "minimal.yaml", "full.json")]
+
+        parallel = load_rirekisho_batch(paths, max_workers=2)
+        sequential = load_rirekisho_batch(paths, max_workers=1)
+
+        assert parallel == sequential == [load_rirekisho_data(path) for path in paths]
+
+    def test_batch_propagates_errors(
+        self, valid_fixtures_dir: Path, invalid_fixtures_dir: Path
+    ) -> None:
+        """異常系: いずれかのファイルが不正な場合は例外がそのまま送出される"""
+        paths = [valid_fixtures_dir / "minimal.yaml", invalid_fixtures_dir / "missing_name.yaml"]
+        with pytest.raises(ValidationError) as exc_info:
+            load_rirekisho_batch(paths, max_workers=2)
+        assert exc_info.value.validator == "required"
+        assert list(exc_info.value.path) == ["personal_info"]
+
+    def test_batch_error_location_matches_serial(
+        self, valid_fixtures_dir: Path, invalid_fixtures_dir: Path
+    ) -> None:
+        """異常系: 並列読み込みのエラー位置は逐次読み込みと一致する"""
+        invalid_path = invalid_fixtures_dir / "invalid_birthdate.yaml"
+        with pytest.raises(ValidationError) as serial_info:
+            load_rirekisho_data(invalid_path)
+        with pytest.raises(ValidationError) as batch_info:
+            load_rirekisho_batch([valid_fixtures_dir / "minimal.yaml", invalid_path], max_workers=2)
+
+        assert batch_info.value.absolute_path == serial_info.value.absolute_path
+        assert batch_info.value.absolute_schema_path == serial_info.value.absolute_schema_path
+
+    def test_worker_error_keeps_absolute_path_of_nested_error(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """異常系: anyOf等の配下（parentあり）のエラーも絶対パスのまま作り直される"""
+        from jtr import rirekisho_data
+
+        parent = ValidationError("parent", path=["personal_info"], schema_path=["anyOf"])
+        child = ValidationError("child", path=["phone"], schema_path=[0, "pattern"])
+        child.parent = parent
+
+        def raise_nested(_path: Path) -> None:
+            raise child
+
+        monkeypatch.setattr(rirekisho_data, "load_rirekisho_data", raise_nested)
+
+        with pytest.raises(ValidationError) as exc_info:
+            rirekisho_data._load_rirekisho_in_worker(Path("data.yaml"))
+
+        assert list(exc_info.value.absolute_path) == ["personal_info", "phone"]
+        assert list(exc_info.value.absolute_schema_path) == ["anyOf", 0, "pattern"]
+
+    def test_batch_empty(self) -> None:
+        """境界値: 空のリストは空の結果を返す"""
+        assert load_rirekisho_batch([]) == []